@@ -0,0 +1,44 @@
+"""
+Micro-benchmark of request serialization
+
+Compares building and serializing a getProperty request for every call against reusing a
+RequestTemplate. Run with: python benchmarks/bench_requests.py
+"""
+
+import os
+import sys
+import timeit
+
+# Run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slsc_web.requests import GetPropertyRequest, RequestTemplate, set_json_backend
+
+RESOURCES = ",".join(f"Mod{slot}" for slot in range(1, 13))
+NUMBER = 100000
+
+
+def build_and_serialize(id: int) -> str:
+    return GetPropertyRequest(id, "_session0", "Dev.Temperature", devices=RESOURCES).serialize()
+
+
+def run(backend: str):
+    set_json_backend(backend)
+    template = RequestTemplate(GetPropertyRequest(0, "_session0", "Dev.Temperature", RESOURCES))
+
+    cases = {
+        "Request.serialize": lambda: build_and_serialize(7),
+        "RequestTemplate": lambda: template.bind(7).serialize(),
+    }
+
+    for name, function in cases.items():
+        seconds = min(timeit.repeat(function, number=NUMBER, repeat=3))
+        print(f"{backend:>6} {name:<20} {NUMBER / seconds:>12,.0f} requests/s")
+
+
+if __name__ == "__main__":
+    run("json")
+    try:
+        run("orjson")
+    except ImportError:
+        print("orjson not installed")
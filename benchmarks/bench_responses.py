@@ -0,0 +1,65 @@
+"""
+Micro-benchmark of response construction
+
+Measures responses created per second, with and without reading a field, and the memory held by
+each response object. Run with: python benchmarks/bench_responses.py
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+# Run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slsc_web.responses import GetPropertyInformationResponse, GetPropertyResponse
+
+NUMBER = 200000
+
+PROPERTY = {"id": "7", "jsonrpc": "2.0", "result": {"data_type": "Double", "value": 1.5}}
+INFORMATION = {
+    "id": "7",
+    "jsonrpc": "2.0",
+    "result": {
+        "description": "Excitation voltage",
+        "documentation": "",
+        "data_type": "Double",
+        "access": "ReadWrite",
+        "unit": "V",
+        "min_value": 0.0,
+        "max_value": 10.0,
+    },
+}
+
+
+def object_size(response_type: type, data: dict, count: int = 10000) -> float:
+    tracemalloc.start()
+    responses = [response_type(data) for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (size - responses.__sizeof__()) / count
+
+
+def run():
+    cases = [
+        (GetPropertyResponse, PROPERTY, "value"),
+        (GetPropertyInformationResponse, INFORMATION, "maximum_value"),
+    ]
+
+    for response_type, data, field in cases:
+        create = min(timeit.repeat(lambda: response_type(data), number=NUMBER, repeat=3))
+        read = min(
+            timeit.repeat(lambda: getattr(response_type(data), field), number=NUMBER, repeat=3)
+        )
+        print(
+            f"{response_type.__name__:<32}"
+            f"{NUMBER / create:>12,.0f} created/s"
+            f"{NUMBER / read:>12,.0f} created+read/s"
+            f"{object_size(response_type, data):>8.0f} B/response"
+        )
+
+
+if __name__ == "__main__":
+    run()
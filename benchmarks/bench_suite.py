@@ -0,0 +1,174 @@
+"""
+End-to-end benchmark suite
+
+Measures request serialization, response construction and get_property round trips against a
+local Simulator (single resource, twelve resources, batches and many threads sharing a session).
+Results are written as JSON and can be compared with the results of an earlier run, exiting with
+status 1 if any case got slower than the threshold.
+
+Run with: python benchmarks/bench_suite.py --output results.json [--baseline old.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+# Run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_requests import RESOURCES, build_and_serialize
+from bench_responses import INFORMATION, PROPERTY
+
+import slsc_web
+from slsc_web.protocols import close_pools, configure_pool
+from slsc_web.requests import GetPropertyRequest, RequestTemplate
+from slsc_web.responses import GetPropertyInformationResponse, GetPropertyResponse
+from slsc_web.session import Device
+from slsc_web.simulator import Simulator, default_devices
+
+
+def throughput(function, number: int) -> dict:
+    seconds = min(timeit.repeat(function, number=number, repeat=3))
+    return {"ops_per_second": number / seconds}
+
+
+def latency(function, number: int, threads: int = 1) -> dict:
+    """
+    Calls function number times from threads, returning throughput and latency percentiles
+    """
+
+    def timed(_) -> float:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    if threads == 1:
+        samples = [timed(index) for index in range(number)]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            samples = list(executor.map(timed, range(number)))
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(samples, n=100)
+    return {
+        "ops_per_second": number / elapsed,
+        "p50_ms": percentiles[49] * 1000,
+        "p95_ms": percentiles[94] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+    }
+
+
+def offline_cases(scale: float) -> dict:
+    template = RequestTemplate(GetPropertyRequest(0, "_session0", "Dev.Temperature", RESOURCES))
+    number = int(100000 * scale)
+
+    return {
+        "serialize/single": throughput(
+            lambda: GetPropertyRequest(7, "_session0", "Dev.Temperature", "Mod1").serialize(),
+            number,
+        ),
+        "serialize/multi": throughput(lambda: build_and_serialize(7), number),
+        "serialize/template": throughput(lambda: template.bind(7).serialize(), number),
+        "response/property": throughput(lambda: GetPropertyResponse(PROPERTY).value, number),
+        "response/information": throughput(
+            lambda: GetPropertyInformationResponse(INFORMATION).maximum_value, number
+        ),
+    }
+
+
+def round_trip_cases(scale: float, threads: int) -> dict:
+    number = int(2000 * scale)
+
+    with Simulator(default_devices(modules=12)) as simulator:
+        configure_pool(simulator.address, maxsize=threads, block=True)
+        single = Device(simulator.address, "Mod1")
+        multi = Device(simulator.address, RESOURCES)
+
+        def read_batch():
+            with multi.batch() as batch:
+                for _ in range(10):
+                    batch.get_property("Dev.Temperature")
+
+        results = {
+            "round_trip/single": latency(lambda: single.get_property("Dev.Temperature"), number),
+            "round_trip/multi": latency(lambda: multi.get_property("Dev.Temperature"), number),
+            "round_trip/batch10": latency(read_batch, number // 10),
+            f"round_trip/threads{threads}": latency(
+                lambda: single.get_property("Dev.Temperature"), number * 2, threads
+            ),
+        }
+        single.close()
+        multi.close()
+
+    close_pools()
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Returns cases whose throughput dropped by more than threshold relative to baseline
+    """
+
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        ratio = result["ops_per_second"] / previous["ops_per_second"]
+        if ratio < 1 - threshold:
+            regressions.append((name, ratio))
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown (0.1=10%%)")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies iteration counts")
+    arguments = parser.parse_args()
+
+    results = offline_cases(arguments.scale)
+    results.update(round_trip_cases(arguments.scale, arguments.threads))
+
+    for name, result in results.items():
+        detail = "".join(
+            f"  {key} {value:.3f}" for key, value in result.items() if key != "ops_per_second"
+        )
+        print(f"{name:<24} {result['ops_per_second']:>12,.0f} ops/s{detail}")
+
+    report = {
+        "metadata": {
+            "version": slsc_web.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+    with open(arguments.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            regressions = compare(results, json.load(file)["results"], arguments.threshold)
+        for name, ratio in regressions:
+            print(f"Regression: {name} at {ratio:.0%} of baseline throughput")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+from slsc_web.responses import GetPropertyResponse, PropertyDataType, _ResultField
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+_DTYPES = {
+    PropertyDataType.Bool: "bool",
+    PropertyDataType.Double: "float64",
+    PropertyDataType.Int32: "int32",
+    PropertyDataType.Int64: "int64",
+    PropertyDataType.String: "str",
+    PropertyDataType.Uint32: "uint32",
+    PropertyDataType.Uint64: "uint64",
+    PropertyDataType.BoolArray: "bool",
+    PropertyDataType.DoubleArray: "float64",
+    PropertyDataType.Int32Array: "int32",
+    PropertyDataType.Int64Array: "int64",
+    PropertyDataType.StringArray: "str",
+    PropertyDataType.Uint32Array: "uint32",
+    PropertyDataType.Uint64Array: "uint64",
+}
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for NumPy property values")
+
+
+def to_numpy(data_type: str, value):
+    """
+    Converts a getProperty value to NumPy using the dtype matching data_type.
+
+    Array values become 1-D arrays, and arrays read from several resources become 2-D arrays with
+    one row per resource. Scalars read from several resources become one vector in resource
+    order, and a single scalar becomes a NumPy scalar.
+    Values of unknown data types are returned unchanged.
+    """
+
+    require_numpy()
+
+    dtype = _DTYPES.get(PropertyDataType.__members__.get(data_type))
+    if dtype is None or value is None:
+        return value
+
+    array = np.asarray(value, dtype=dtype)
+    if array.ndim == 0:
+        return array[()]
+
+    return array
+
+
+class _NumpyValueField(_ResultField):
+    """
+    Property value decoded to NumPy on first access and kept on the response
+    """
+
+    def __get__(self, response, owner: type = None):
+        if response is None:
+            return self
+
+        assigned = response._assigned
+        if assigned is not None and self._name in assigned:
+            return assigned[self._name]
+
+        value = to_numpy(response.data_type, super().__get__(response, owner))
+        if response._assigned is None:
+            response._assigned = {}
+        response._assigned[self._name] = value
+
+        return value
+
+
+class NumpyGetPropertyResponse(GetPropertyResponse):
+
+    """
+    Response of getProperty request with value decoded to NumPy
+    """
+
+    __slots__ = ()
+
+    value = _NumpyValueField("value")
@@ -0,0 +1,279 @@
+import itertools
+from abc import ABC, abstractmethod
+from typing import List, Union
+from slsc_web.requests import *
+from slsc_web.responses import *
+from slsc_web.protocols import AsyncJSON_RPC
+from slsc_web.monitor import AsyncPropertyMonitor
+
+
+class AsyncSLSC_Session(ABC):
+    """
+    Asyncio version of SLSC_Session.
+
+    The session is initialized when entering an async with block or by awaiting open().
+    """
+
+    def __init__(
+        self, chassis: str, resources: Union[str, ResourceSet], max_concurrency: int = None
+    ):
+        self._rpc = AsyncJSON_RPC(chassis, max_concurrency)
+        self._uid = itertools.count(1)
+        self._session_id = ""
+        self._resources = ResourceSet(resources)
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+        self._rpc.close()
+
+    @abstractmethod
+    async def initialize(self, resources: str) -> InitializeResponse:
+        pass
+
+    async def open(self) -> InitializeResponse:
+        """
+        Initializes the session with the resources given at construction
+        """
+
+        response = await self.initialize(self._resources)
+        if response.has_error():
+            print(response.error)
+        else:
+            self._session_id = response.session_id
+
+        return response
+
+    async def _query(self, request: Request) -> dict:
+        return await self._rpc.query(request)
+
+    async def _query_batch(self, requests: List[Request]) -> List[dict]:
+        return await self._rpc.query_batch(requests)
+
+    def _get_uid(self) -> int:
+        """
+        Returns incrementing unique ID starting at 1
+        """
+
+        return next(self._uid)
+
+    async def close(self) -> GenericResponse:
+        """
+        Closes any open SLSC references
+        """
+
+        request = CloseRequest(self._get_uid(), self._session_id)
+        response = await self._query(request)
+
+        return GenericResponse(response)
+
+    async def abort(self) -> GenericResponse:
+        """
+        Cancels a method that blocks network communications
+        """
+
+        request = AbortRequest(self._get_uid(), self._session_id)
+        response = await self._query(request)
+
+        return GenericResponse(response)
+
+    async def connect(self, devices: str = None) -> GenericResponse:
+        """
+        Connects to an SLSC device.
+
+        By default, connect to session device(s)
+        """
+
+        if devices is None:
+            devices = self._resources
+
+        request = ConnectToDevicesRequest(self._get_uid(), self._session_id, devices)
+        response = await self._query(request)
+
+        return GenericResponse(response)
+
+    async def disconnect(self, devices: str = None) -> GenericResponse:
+        """
+        Disconnects from an SLSC device.
+
+        By default, disconnect from session device(s)
+        """
+
+        if devices is None:
+            devices = self._resources
+
+        request = DisconnectFromDevicesRequest(self._get_uid(), self._session_id, devices)
+        response = await self._query(request)
+
+        return GenericResponse(response)
+
+    async def get_session_properties(self) -> GetSessionPropertyListResponse:
+        """
+        Lists all session properties
+        """
+
+        request = GetSessionPropertyListRequest(self._get_uid(), self._session_id)
+        response = await self._query(request)
+
+        return GetSessionPropertyListResponse(response)
+
+
+class AsyncDevice(AsyncSLSC_Session):
+    """
+    Asyncio reference to SLSC devices.
+    Used to query and command SLSC chassis/modules from an event loop
+    """
+
+    def __init__(self, chassis: str, devices: str, max_concurrency: int = None):
+        super().__init__(chassis, devices, max_concurrency)
+
+    async def initialize(self, resources: str) -> InitializeResponse:
+        """
+        Initialize SLSC connection, returning session ID
+        """
+
+        request = InitializeRequest(self._get_uid(), devices=resources)
+        response = await self._query(request)
+
+        return InitializeResponse(response)
+
+    async def get_property_list(self, resource: str = None) -> GetPropertyListResponse:
+        """
+        Lists properties of given device.
+        No input resource will return properties of first resource in session.
+        """
+
+        if resource is None:  # set resource to first resource
+            resource = split_resources(self._resources)[0]
+
+        request = GetDevicePropertyListRequest(self._get_uid(), self._session_id, resource)
+        response = await self._query(request)
+
+        return GetPropertyListResponse(response)
+
+    async def get_property(self, property: str, resources: str = None) -> GetPropertyResponse:
+        if resources is None:
+            resources = self._resources
+
+        request = GetPropertyRequest(self._get_uid(), self._session_id, property, devices=resources)
+        response = await self._query(request)
+
+        return GetPropertyResponse(response)
+
+    def monitor(
+        self,
+        properties: Union[str, List[str]],
+        resources: str = None,
+        rate: float = 1.0,
+        change_only: bool = False,
+    ) -> AsyncPropertyMonitor:
+        """
+        Reads properties at rate samples per second, yielding a MonitorSample per tick.
+
+        Use with async for. See Device.monitor.
+        """
+
+        return AsyncPropertyMonitor(self, properties, resources, rate, change_only)
+
+    async def get_property_information(
+        self, property: str, resources: str = None
+    ) -> GetPropertyInformationResponse:
+        """
+        Gets all information of a property
+
+        Leaving resources empty will use the resources opened with this session
+        """
+        if resources is None:
+            resources = self._resources
+
+        request = GetPropertyInformationRequest(
+            self._get_uid(), self._session_id, property, devices=resources
+        )
+        response = await self._query(request)
+
+        return GetPropertyInformationResponse(response)
+
+    async def rename_device(self, device: str, new_name: str) -> GenericResponse:
+        """
+        Renames device to new_name
+        """
+
+        request = RenameDeviceRequest(self._get_uid(), self._session_id, device, new_name)
+        response = await self._query(request)
+
+        return GenericResponse(response)
+
+    async def reserve_devices(
+        self,
+        devices: str = None,
+        access: AccessType = AccessType.ReadWrite,
+        reservation_group: str = "",
+        reservation_timeout: float = 0.0,
+    ) -> GenericResponse:
+        """
+        Reserves one or multiple devices to prevent other sessions from accessing the devices.
+        You must reserve a device before using it.
+        """
+
+        if devices is None:
+            devices = self._resources
+
+        request = ReserveDeviceRequest(
+            self._get_uid(),
+            self._session_id,
+            devices,
+            access,
+            reservation_group,
+            reservation_timeout,
+        )
+        response = await self._query(request)
+
+        return GenericResponse(response)
+
+    async def reset_devices(self, devices: str = None) -> GenericResponse:
+        """
+        Resets devices to default state.
+
+        By default the function will reset the session devices
+        """
+
+        if devices is None:
+            devices = self._resources
+
+        request = ResetDevicesRequest(self._get_uid(), self._session_id, devices)
+        response = await self._query(request)
+
+        return GenericResponse(response)
+
+    async def unreserve_devices(self, devices: str = None) -> GenericResponse:
+        """
+        Unreserves one or multiple devices so that other sessions can reserve them.
+
+        By default, function will unreserve session devices
+        """
+
+        if devices is None:
+            devices = self._resources
+
+        request = UnreserveDevicesRequest(self._get_uid(), self._session_id, devices)
+        response = await self._query(request)
+
+        return GenericResponse(response)
+
+    async def commit_properties(self, devices: str = None) -> GenericResponse:
+        """
+        Commits properties with pending changes to SLSC hardware.
+
+        By default, function will commit session devices
+        """
+
+        if devices is None:
+            devices = self._resources
+
+        request = CommitPropertiesRequest(self._get_uid(), self._session_id, devices)
+        response = await self._query(request)
+
+        return GenericResponse(response)
@@ -0,0 +1,183 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from typing import Hashable, Iterable, NamedTuple
+
+
+class CacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MetadataCache:
+    """
+    In-process LRU cache for property metadata responses
+
+    Entries are keyed by chassis and a request key ending with the tuple of resources the request
+    refers to. Entries expire after ttl seconds (never if ttl is None).
+    Once maxsize entries are stored, the least recently used entry is evicted.
+    A single cache can be shared by many sessions.
+
+    An optional DiskMetadataStore is consulted by sessions when an entry is not in memory.
+    Entries shared by identical modules are keyed by the values of model_property and
+    firmware_property, or those of the store if given.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = None,
+        store: "DiskMetadataStore" = None,
+        model_property: str = "Dev.ProductName",
+        firmware_property: str = "Dev.FirmwareRevision",
+    ):
+        self.store = store
+        self.model_property = model_property
+        self.firmware_property = firmware_property
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, chassis: str, key: Hashable):
+        """
+        Returns cached value or None if not cached or expired
+        """
+
+        with self._lock:
+            entry = self._entries.get((chassis, key))
+            if entry is not None and self._ttl is not None and entry[0] < time.monotonic():
+                del self._entries[(chassis, key)]
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end((chassis, key))
+            self._hits += 1
+            return entry[1]
+
+    def put(self, chassis: str, key: Hashable, value):
+        with self._lock:
+            expires = time.monotonic() + self._ttl if self._ttl is not None else None
+            self._entries[(chassis, key)] = (expires, value)
+            self._entries.move_to_end((chassis, key))
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, chassis: str = None, resources: Iterable[str] = None):
+        """
+        Removes cached entries.
+
+        No chassis clears the whole cache. Given resources, only entries of that chassis whose
+        key references one of the resources are removed.
+        """
+
+        with self._lock:
+            if chassis is None:
+                self._entries.clear()
+                return
+
+            resources = set(resources) if resources is not None else None
+            for cached_chassis, key in list(self._entries):
+                if cached_chassis != chassis:
+                    continue
+                if resources is None or resources.intersection(key[-1]):
+                    del self._entries[(cached_chassis, key)]
+
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(self._hits, self._misses, self._evictions, len(self._entries))
+
+
+class ValueCache(MetadataCache):
+    """
+    In-process LRU cache for values of static properties
+
+    Sessions only store values of properties listed as static by getDevicePropertyList.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = None):
+        super().__init__(maxsize, ttl)
+
+
+class DiskMetadataStore:
+    """
+    Persistent single-file store for property metadata, shared between processes
+
+    Raw responses are keyed by module model and firmware version, so that new sessions can reuse
+    metadata fetched by earlier processes. Modules whose firmware changed miss the store and are
+    fetched again. The store is an SQLite database, which serializes concurrent writers.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model_property: str = "Dev.ProductName",
+        firmware_property: str = "Dev.FirmwareRevision",
+        timeout: float = 30.0,
+    ):
+        self.path = path
+        self.model_property = model_property
+        self.firmware_property = firmware_property
+        self._timeout = timeout
+
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "model TEXT, firmware TEXT, key TEXT, data TEXT, "
+                "PRIMARY KEY (model, firmware, key))"
+            )
+
+    def _connect(self) -> closing:
+        return closing(sqlite3.connect(self.path, timeout=self._timeout, isolation_level=None))
+
+    def get(self, model: str, firmware: str, key: Hashable) -> dict:
+        """
+        Returns stored response data or None if not stored
+        """
+
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT data FROM metadata WHERE model = ? AND firmware = ? AND key = ?",
+                (model, firmware, json.dumps(key)),
+            ).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, model: str, firmware: str, key: Hashable, data: dict):
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?)",
+                (model, firmware, json.dumps(key), json.dumps(data)),
+            )
+
+    def clear(self, model: str = None):
+        """
+        Removes stored metadata of given model, or everything if model is None
+        """
+
+        with self._connect() as db:
+            if model is None:
+                db.execute("DELETE FROM metadata")
+            else:
+                db.execute("DELETE FROM metadata WHERE model = ?", (model,))
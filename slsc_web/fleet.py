@@ -0,0 +1,176 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+from slsc_web.requests import AccessType
+from slsc_web.session import Device
+
+
+class FleetResult(dict):
+    """
+    Results of a fleet operation keyed by chassis.
+
+    Chassis whose operation raised an exception hold the exception instead of a response.
+    """
+
+    @property
+    def errors(self) -> dict:
+        """
+        Exceptions and response errors keyed by chassis
+        """
+        errors = {}
+        for chassis, result in self.items():
+            if isinstance(result, Exception):
+                errors[chassis] = result
+            elif hasattr(result, "has_error") and result.has_error():
+                errors[chassis] = result.error
+
+        return errors
+
+    def ok(self) -> bool:
+        """
+        True when no chassis returned an error
+        """
+        return not self.errors
+
+
+class Fleet:
+    """
+    Group of Device sessions, one per chassis, operated on in parallel.
+
+    Every operation is run on all chassis at the same time and returns a FleetResult.
+    """
+
+    def __init__(self, devices: Dict[str, str], max_workers: int = None):
+        """
+        devices maps each chassis to the device(s) to open a session with
+        """
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or max(len(devices), 1), thread_name_prefix="slsc-fleet"
+        )
+        self._devices = {}
+
+        sessions = self._run(devices, self._open)
+        for chassis, session in sessions.items():
+            if not isinstance(session, Exception):
+                self._devices[chassis] = session
+
+        self.init_errors = sessions.errors
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getitem__(self, chassis: str) -> Device:
+        return self._devices[chassis]
+
+    def __iter__(self):
+        return iter(self._devices)
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    @staticmethod
+    def _open(chassis: str, devices: str) -> Device:
+        device = Device(chassis, devices)
+        if not device._session_id:
+            device._rpc.close()
+            raise ConnectionError(f"Failed to initialize session on {chassis}")
+
+        return device
+
+    def _run(self, items: dict, function: Callable) -> FleetResult:
+        futures = {key: self._executor.submit(function, key, item) for key, item in items.items()}
+
+        results = FleetResult()
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as error:
+                results[key] = error
+
+        return results
+
+    def map(self, function: Callable[[Device], object]) -> FleetResult:
+        """
+        Calls function with the Device of every chassis in parallel
+        """
+
+        return self._run(self._devices, lambda chassis, device: function(device))
+
+    def call(self, method: str, *args, **kwargs) -> FleetResult:
+        """
+        Calls the named Device method with the same arguments on every chassis in parallel
+        """
+
+        return self.map(lambda device: getattr(device, method)(*args, **kwargs))
+
+    def connect(self) -> FleetResult:
+        return self.call("connect")
+
+    def disconnect(self) -> FleetResult:
+        return self.call("disconnect")
+
+    def reserve_devices(
+        self,
+        access: AccessType = AccessType.ReadWrite,
+        reservation_group: str = "",
+        reservation_timeout: float = 0.0,
+    ) -> FleetResult:
+        return self.call(
+            "reserve_devices",
+            access=access,
+            reservation_group=reservation_group,
+            reservation_timeout=reservation_timeout,
+        )
+
+    def unreserve_devices(self) -> FleetResult:
+        return self.call("unreserve_devices")
+
+    def reset_devices(self) -> FleetResult:
+        return self.call("reset_devices")
+
+    def commit_properties(self) -> FleetResult:
+        return self.call("commit_properties")
+
+    def get_property(self, property: str) -> FleetResult:
+        return self.call("get_property", property)
+
+    def get_property_information(self, property: str) -> FleetResult:
+        return self.call("get_property_information", property)
+
+    def get_property_list(self) -> FleetResult:
+        return self.call("get_property_list")
+
+    def execute_command(self, command: str) -> FleetResult:
+        """
+        Runs command on every device of every chassis at once.
+
+        Results are the responses of each chassis keyed by device.
+        """
+
+        handles = self.map(lambda device: device.start_command(command))
+
+        def collect(chassis: str, handle):
+            if isinstance(handle, Exception):
+                raise handle
+            return handle.result()
+
+        return self._run(handles, collect)
+
+    def close(self) -> FleetResult:
+        """
+        Closes the session of every chassis
+        """
+
+        def close(device: Device):
+            response = device.close()
+            device._rpc.close()
+            return response
+
+        results = self.map(close)
+        self._devices = {}
+        self._executor.shutdown()
+
+        return results
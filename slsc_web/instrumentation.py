@@ -0,0 +1,287 @@
+import bisect
+import logging
+import threading
+from typing import Callable, Dict, NamedTuple, Tuple, Union
+
+# Metrics receiving every JSON RPC call, None while instrumentation is disabled
+active = None
+
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CallRecord(NamedTuple):
+    """
+    Measurements of one JSON RPC call. Times are in seconds.
+
+    transport is "batch" for requests sent in a batch, which are recorded one by one with the
+    times of the whole batch. errors holds the error code of a failed request, or the exception
+    class name if the call failed in transport, e.g. on a timeout.
+    """
+
+    chassis: str
+    method: str
+    serialize: float
+    network: float
+    parse: float
+    request_bytes: int
+    response_bytes: int
+    errors: Tuple[Union[int, str], ...] = ()
+    transport: str = "single"
+
+    @property
+    def duration(self) -> float:
+        return self.serialize + self.network + self.parse
+
+
+class Histogram:
+    """
+    Latency histogram with fixed upper bucket bounds in seconds
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...] = BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other: "Histogram"):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.sum += other.sum
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q quantile, inf if beyond the last bound
+        """
+
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            if total >= rank and total:
+                return bound
+        return float("inf")
+
+
+class _Series:
+    """
+    Measurements of the calls of one method to one chassis over one transport
+    """
+
+    __slots__ = ("latency", "serialize", "network", "parse", "request_bytes", "response_bytes")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.latency = Histogram(bounds)
+        self.serialize = self.network = self.parse = 0.0
+        self.request_bytes = self.response_bytes = 0
+
+
+class Metrics:
+    """
+    Collects CallRecords of JSON RPC calls while enabled, see enable().
+
+    Keeps a latency histogram, the time spent serializing, on the network and parsing, and byte
+    counts per chassis, method and transport, and counts errors by code. Exporters are called with
+    every CallRecord after it is recorded.
+    """
+
+    def __init__(self, bounds: Tuple[float, ...] = BUCKETS):
+        self._bounds = bounds
+        self._lock = threading.Lock()
+        self._series = {}
+        self._errors = {}
+        self._exporters = []
+
+    def add_exporter(self, exporter: Callable[[CallRecord], None]):
+        self._exporters.append(exporter)
+
+    def record(self, call: CallRecord):
+        with self._lock:
+            key = (call.chassis, call.method, call.transport)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(self._bounds)
+            series.latency.observe(call.duration)
+            series.serialize += call.serialize
+            series.network += call.network
+            series.parse += call.parse
+            series.request_bytes += call.request_bytes
+            series.response_bytes += call.response_bytes
+            for code in call.errors:
+                key = (call.chassis, call.method, code)
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+        for exporter in self._exporters:
+            exporter(call)
+
+    def reset(self):
+        with self._lock:
+            self._series = {}
+            self._errors = {}
+
+    def _histograms(self, index: int) -> Dict[str, Histogram]:
+        histograms = {}
+        with self._lock:
+            for key, series in self._series.items():
+                if key[index] not in histograms:
+                    histograms[key[index]] = Histogram(self._bounds)
+                histograms[key[index]].merge(series.latency)
+        return histograms
+
+    def by_chassis(self) -> Dict[str, Histogram]:
+        """
+        Latency histograms of all methods merged per chassis
+        """
+        return self._histograms(0)
+
+    def by_method(self) -> Dict[str, Histogram]:
+        """
+        Latency histograms of all chassis merged per method
+        """
+        return self._histograms(1)
+
+    def phases(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        Total serialize, network and parse seconds per (chassis, method)
+        """
+        phases = {}
+        with self._lock:
+            for (chassis, method, _), series in self._series.items():
+                totals = phases.setdefault(
+                    (chassis, method), {"serialize": 0.0, "network": 0.0, "parse": 0.0}
+                )
+                totals["serialize"] += series.serialize
+                totals["network"] += series.network
+                totals["parse"] += series.parse
+        return phases
+
+    def errors(self) -> Dict[Tuple[str, str, Union[int, str]], int]:
+        """
+        Error counts per (chassis, method, code)
+        """
+        with self._lock:
+            return dict(self._errors)
+
+    def to_prometheus(self, prefix: str = "slsc") -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format
+        """
+
+        with self._lock:
+            series = sorted(self._series.items())
+            errors = sorted(self._errors.items(), key=lambda item: tuple(map(str, item[0])))
+
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Duration of JSON RPC calls",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for (chassis, method, transport), values in series:
+            labels = f'chassis="{chassis}",method="{method}",transport="{transport}"'
+            total = 0
+            for bound, count in zip(values.latency.bounds, values.latency.counts):
+                total += count
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {total}'
+                )
+            count = values.latency.count
+            lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {values.latency.sum}")
+            lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {count}")
+
+        lines += [
+            f"# HELP {prefix}_request_phase_seconds_total Time spent per phase of JSON RPC calls",
+            f"# TYPE {prefix}_request_phase_seconds_total counter",
+        ]
+        for (chassis, method, transport), values in series:
+            for phase in ("serialize", "network", "parse"):
+                lines.append(
+                    f'{prefix}_request_phase_seconds_total{{chassis="{chassis}",method="{method}",'
+                    f'transport="{transport}",phase="{phase}"}} {getattr(values, phase)}'
+                )
+
+        lines += [
+            f"# HELP {prefix}_request_bytes_total Bytes of JSON RPC calls",
+            f"# TYPE {prefix}_request_bytes_total counter",
+        ]
+        for (chassis, method, transport), values in series:
+            for direction, count in (
+                ("sent", values.request_bytes),
+                ("received", values.response_bytes),
+            ):
+                lines.append(
+                    f'{prefix}_request_bytes_total{{chassis="{chassis}",method="{method}",'
+                    f'transport="{transport}",direction="{direction}"}} {count}'
+                )
+
+        lines += [
+            f"# HELP {prefix}_request_errors_total Errors returned by JSON RPC calls",
+            f"# TYPE {prefix}_request_errors_total counter",
+        ]
+        for (chassis, method, code), count in errors:
+            lines.append(
+                f'{prefix}_request_errors_total{{chassis="{chassis}",method="{method}",'
+                f'code="{code}"}} {count}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def enable(metrics: Metrics = None) -> Metrics:
+    """
+    Starts recording every JSON RPC call into metrics, or into new Metrics if None
+    """
+
+    global active
+    active = metrics if metrics is not None else Metrics()
+    return active
+
+
+def disable():
+    """
+    Stops recording JSON RPC calls. Calls are then sent without any measurement.
+    """
+
+    global active
+    active = None
+
+
+def logging_exporter(
+    logger: logging.Logger = None, level: int = logging.DEBUG
+) -> Callable[[CallRecord], None]:
+    """
+    Creates an exporter logging one line per call
+    """
+
+    logger = logger or logging.getLogger("slsc_web.instrumentation")
+
+    def export(call: CallRecord):
+        if logger.isEnabledFor(level):
+            logger.log(
+                level,
+                "%s %s (%s) %.3f ms (serialize %.3f, network %.3f, parse %.3f) "
+                "%d/%d bytes errors %s",
+                call.chassis,
+                call.method,
+                call.transport,
+                call.duration * 1000,
+                call.serialize * 1000,
+                call.network * 1000,
+                call.parse * 1000,
+                call.request_bytes,
+                call.response_bytes,
+                list(call.errors),
+            )
+
+    return export
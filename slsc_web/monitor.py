@@ -0,0 +1,151 @@
+import asyncio
+import time
+from typing import List, NamedTuple, Union
+from slsc_web.requests import GetPropertyRequest, RequestTemplate
+from slsc_web.responses import GetPropertyResponse
+
+
+class MonitorSample(NamedTuple):
+    """
+    Property values read in one tick of a monitor
+    """
+
+    timestamp: float
+    values: dict
+    errors: dict
+    missed: int
+
+
+class _MonitorBase:
+    """
+    Shared scheduling and decoding of property monitors
+
+    Ticks are scheduled at fixed multiples of the period from the start, so that time spent
+    querying does not accumulate as drift. Ticks that could not be sent on time are skipped and
+    counted as missed.
+    """
+
+    def __init__(
+        self,
+        session,
+        properties: Union[str, List[str]],
+        resources: str = None,
+        rate: float = 1.0,
+        change_only: bool = False,
+    ):
+        if isinstance(properties, str):
+            properties = [properties]
+        if resources is None:
+            resources = session._resources
+
+        self._session = session
+        self._response_type = getattr(session, "_property_response", GetPropertyResponse)
+        self._properties = list(properties)
+        self._templates = [
+            RequestTemplate(GetPropertyRequest(0, session._session_id, property, devices=resources))
+            for property in self._properties
+        ]
+        self._period = 1.0 / rate
+        self._change_only = change_only
+        self._previous = {}
+        self._start = None
+        self._tick = 0
+        self._pending_missed = 0
+        self.missed = 0
+
+    def _requests(self) -> list:
+        return [template.bind(self._session._get_uid()) for template in self._templates]
+
+    def _delay(self) -> float:
+        """
+        Returns seconds until the next tick, skipping ticks whose deadline has passed
+        """
+
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+
+        deadline = self._start + self._tick * self._period
+        late = now - deadline
+        if late > self._period:
+            skipped = int(late // self._period)
+            self._tick += skipped
+            self._pending_missed += skipped
+            self.missed += skipped
+            deadline += skipped * self._period
+
+        self._tick += 1
+        return max(deadline - now, 0.0)
+
+    def _sample(self, timestamp: float, results: List[dict]) -> MonitorSample:
+        """
+        Builds sample from raw results, or returns None if change_only and nothing changed.
+
+        Values are decoded by the get_property response class of the session, and changes are
+        detected on the raw values. Results without a value are reported as errors.
+        """
+
+        values = {}
+        errors = {}
+        for property, data in zip(self._properties, results):
+            if "error" in data:
+                errors[property] = data["error"]
+                continue
+
+            result = data.get("result")
+            if not isinstance(result, dict) or "value" not in result:
+                errors[property] = {"code": -32603, "message": f"No value in result of {property}"}
+                continue
+
+            raw = result["value"]
+            if self._change_only and property in self._previous:
+                if self._previous[property] == raw:
+                    continue
+            self._previous[property] = raw
+            values[property] = self._response_type(data).value
+
+        if self._change_only and not values and not errors:
+            return None
+
+        sample = MonitorSample(timestamp, values, errors, self._pending_missed)
+        self._pending_missed = 0
+
+        return sample
+
+
+class PropertyMonitor(_MonitorBase):
+    """
+    Iterator reading properties of a session at a fixed rate
+
+    All properties are read in one batch per tick. In change_only mode, properties whose value
+    did not change are left out of samples and ticks without changes yield nothing.
+    """
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> MonitorSample:
+        while True:
+            time.sleep(self._delay())
+            timestamp = time.time()
+            sample = self._sample(timestamp, self._session._query_batch(self._requests()))
+            if sample is not None:
+                return sample
+
+
+class AsyncPropertyMonitor(_MonitorBase):
+    """
+    Asynchronous iterator reading properties of a session at a fixed rate
+    """
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> MonitorSample:
+        while True:
+            await asyncio.sleep(self._delay())
+            timestamp = time.time()
+            results = await self._session._query_batch(self._requests())
+            sample = self._sample(timestamp, results)
+            if sample is not None:
+                return sample
@@ -0,0 +1,330 @@
+import json
+import mmap
+import os
+import time
+import zlib
+from typing import Dict, List, Tuple
+from slsc_web.responses import GenericResponse
+from slsc_web.session import NvmemAreas
+
+
+def changed_ranges(
+    old: bytes, new: bytes, max_gap: int = 0, block_size: int = 64
+) -> List[Tuple[int, int]]:
+    """
+    Returns (start, end) ranges of bytes that differ between two equally sized buffers.
+
+    Ranges separated by at most max_gap unchanged bytes are merged, trading a few redundant
+    bytes for fewer writes. Buffers are compared block_size bytes at a time so that unchanged
+    blocks are skipped without a Python level loop over their bytes.
+    """
+
+    old = memoryview(old).cast("B")
+    new = memoryview(new).cast("B")
+    if len(old) != len(new):
+        raise ValueError("Buffers must have the same size")
+
+    ranges = []
+    start = None
+    end = None
+    for block in range(0, len(new), block_size):
+        if old[block : block + block_size] == new[block : block + block_size]:
+            continue
+
+        for index in range(block, min(block + block_size, len(new))):
+            if old[index] == new[index]:
+                continue
+            if start is not None and index - end <= max_gap:
+                end = index + 1
+            else:
+                if start is not None:
+                    ranges.append((start, end))
+                start, end = index, index + 1
+
+    if start is not None:
+        ranges.append((start, end))
+
+    return ranges
+
+
+class NvmemImage:
+    """
+    Local copy of an nvmem area for reading and writing its bytes
+
+    load() reads the area in chunks into a preallocated buffer and keeps a mirror of what the
+    module holds. sync() writes only byte ranges that differ from the mirror and commits once.
+    """
+
+    def __init__(
+        self,
+        session: NvmemAreas,
+        size: int,
+        area: str = None,
+        chunk_size: int = 256,
+        max_gap: int = 8,
+        buffer=None,
+        mirror=None,
+    ):
+        """
+        buffer and mirror may be given as writable memory of size bytes, e.g. slices of a
+        memory-mapped file. By default both are allocated as bytearrays.
+        """
+
+        self._session = session
+        self._area = area
+        self._chunk_size = chunk_size
+        self._max_gap = max_gap
+        self.data = memoryview(buffer if buffer is not None else bytearray(size)).cast("B")
+        self._mirror = memoryview(mirror if mirror is not None else bytearray(size)).cast("B")
+
+        if len(self.data) != size or len(self._mirror) != size:
+            raise ValueError(f"Buffers must be {size} bytes")
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __setitem__(self, index, value):
+        self.data[index] = value
+
+    def load(self) -> List[GenericResponse]:
+        """
+        Reads the whole area from the module. Returns responses with errors.
+        """
+
+        errors = self._session.read_into(self.data, 0, self._area, self._chunk_size)
+        if not errors:
+            self._mirror[:] = self.data
+
+        return errors
+
+    def changes(self) -> List[Tuple[int, int]]:
+        """
+        Returns (start, end) ranges that differ from the module
+        """
+        return changed_ranges(self._mirror, self.data, self._max_gap)
+
+    def sync(self, commit: bool = True) -> List[GenericResponse]:
+        """
+        Writes changed byte ranges, then commits the area once if every write succeeded.
+
+        Returns the setNvmemBytes responses followed by the commit response, if committed.
+        Without commit the ranges still count as changed, so the next sync writes and commits them.
+        """
+
+        ranges = self.changes()
+        if not ranges:
+            return []
+
+        responses = self._session.write_ranges(
+            [(start, self.data[start:end]) for start, end in ranges], self._area, self._chunk_size
+        )
+        if any(response.has_error() for response in responses):
+            return responses
+
+        if not commit:
+            return responses
+
+        responses.append(self._session.commit_nvmem_areas(self._session._area(self._area)))
+        if responses[-1].has_error():
+            return responses
+
+        for start, end in ranges:
+            self._mirror[start:end] = self.data[start:end]
+
+        return responses
+
+
+class NvmemMirror:
+    """
+    Persistent local image of nvmem areas in a memory-mapped file
+
+    For every area the file holds a working image, which tools read and modify in place, and the
+    last image synced with the module. An index next to the file (path + ".json") records the
+    size, checksum and generation of each synced image and when it was synced.
+
+    refresh() only reads areas that are stale: never synced, synced longer than max_age seconds
+    ago, or whose synced image no longer matches its checksum. push() writes local modifications
+    back as minimal byte range writes and commits each modified area once.
+
+    Views returned by mirror[area] remain usable after close(); the file mapping is released
+    once the last of them is garbage collected.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        areas: Dict[str, int],
+        max_age: float = None,
+        chunk_size: int = 256,
+        max_gap: int = 8,
+    ):
+        """
+        areas maps each nvmem area name to its size in bytes
+        """
+
+        self._path = path
+        self._index_path = path + ".json"
+        self._max_age = max_age
+        self._chunk_size = chunk_size
+        self._max_gap = max_gap
+
+        self._layout = {}
+        offset = 0
+        for area, size in areas.items():
+            self._layout[area] = (offset, size)
+            offset += 2 * size
+
+        index = self._read_index()
+        layout_matches = os.path.exists(path) and os.path.getsize(path) == offset
+        layout_matches = layout_matches and all(
+            index.get(area, {}).get("size") == size for area, size in areas.items()
+        )
+        if not layout_matches:
+            index = {}
+
+        self._index = {
+            area: index.get(area, {"size": size, "crc": None, "generation": 0, "synced_at": None})
+            for area, size in areas.items()
+        }
+
+        with open(path, "r+b" if layout_matches else "w+b") as file:
+            if not layout_matches:
+                file.truncate(offset)
+            self._mmap = mmap.mmap(file.fileno(), offset)
+        self._view = memoryview(self._mmap)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getitem__(self, area: str) -> memoryview:
+        """
+        Returns zero-copy view of the working image of area
+        """
+        offset, size = self._layout[area]
+        return self._view[offset : offset + size]
+
+    def _synced(self, area: str) -> memoryview:
+        offset, size = self._layout[area]
+        return self._view[offset + size : offset + 2 * size]
+
+    def image(self, session: NvmemAreas, area: str) -> NvmemImage:
+        """
+        Returns NvmemImage of area backed by the mirror file
+        """
+
+        return NvmemImage(
+            session,
+            self._layout[area][1],
+            area,
+            self._chunk_size,
+            self._max_gap,
+            buffer=self[area],
+            mirror=self._synced(area),
+        )
+
+    def generation(self, area: str) -> int:
+        """
+        Number of times the synced image of area changed
+        """
+        return self._index[area]["generation"]
+
+    def is_modified(self, area: str) -> bool:
+        return self[area] != self._synced(area)
+
+    def stale_areas(self) -> List[str]:
+        """
+        Returns areas refresh() would read.
+
+        Staleness is judged from local state only. Changes made to the module's nvmem by other
+        clients are not detected, so with max_age None an area synced once is never read again.
+        Set max_age or call refresh(force=True) when the module may be modified elsewhere.
+        """
+
+        now = time.time()
+        stale = []
+        for area, entry in self._index.items():
+            if entry["synced_at"] is None:
+                stale.append(area)
+            elif self._max_age is not None and now - entry["synced_at"] > self._max_age:
+                stale.append(area)
+            elif zlib.crc32(self._synced(area)) != entry["crc"]:
+                stale.append(area)
+
+        return stale
+
+    def refresh(self, session: NvmemAreas, force: bool = False) -> Dict[str, list]:
+        """
+        Reads stale areas from the module, returning responses with errors per area.
+
+        Areas with local modifications are skipped unless force discards the modifications.
+        """
+
+        areas = list(self._index) if force else self.stale_areas()
+
+        errors = {}
+        for area in areas:
+            if not force and self.is_modified(area) and self._index[area]["synced_at"]:
+                continue
+
+            errors[area] = self.image(session, area).load()
+            if not errors[area]:
+                self._mark_synced(area)
+
+        self._write_index()
+        return errors
+
+    def push(self, session: NvmemAreas, commit: bool = True) -> Dict[str, List[GenericResponse]]:
+        """
+        Writes locally modified areas to the module, returning responses per area.
+
+        Areas only count as synced once committed, so areas pushed without commit are written
+        again by the next push.
+        """
+
+        responses = {}
+        for area in self._index:
+            if not self.is_modified(area):
+                continue
+
+            image = self.image(session, area)
+            responses[area] = image.sync(commit)
+            if not image.changes():
+                self._mark_synced(area)
+
+        self._write_index()
+        return responses
+
+    def close(self):
+        self._write_index()
+        self._view.release()
+        self._mmap.flush()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views of areas are still held by callers. The mapping is closed when they are freed.
+            pass
+
+    def _mark_synced(self, area: str):
+        entry = self._index[area]
+        entry["crc"] = zlib.crc32(self._synced(area))
+        entry["generation"] += 1
+        entry["synced_at"] = time.time()
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self._index_path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        temporary = self._index_path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump(self._index, file)
+        os.replace(temporary, self._index_path)
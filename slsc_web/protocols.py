@@ -1,21 +1,431 @@
+import asyncio
+import socket
+import threading
+import time
 import urllib3
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple
+from urllib3.connection import HTTPConnection
+from slsc_web import instrumentation
 from slsc_web.requests import Request
 
 
+class PoolConfig(NamedTuple):
+    """
+    Settings of the connection pool shared by all sessions to a chassis
+
+    keep_alive_idle enables TCP keep-alive probes after the given idle seconds (None disables).
+    With block, requests wait for a free connection instead of opening extra connections.
+    """
+
+    maxsize: int = 10
+    block: bool = False
+    connect_timeout: float = 5.0
+    read_timeout: float = 60.0
+    keep_alive_idle: float = 30.0
+
+
+class PoolStatistics(NamedTuple):
+    requests: int
+    new_connections: int
+    reuses: int
+    wait_time: float
+
+
+class _ChassisPool(urllib3.HTTPConnectionPool):
+    """
+    HTTP connection pool counting connection setups, reuses and time spent waiting for a connection
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._new_connections = 0
+        self._wait_time = 0.0
+
+    def _get_conn(self, timeout=None):
+        start = time.perf_counter()
+        conn = super()._get_conn(timeout)
+        wait = time.perf_counter() - start
+
+        with self._stats_lock:
+            self._wait_time += wait
+
+        return conn
+
+    def _make_request(self, conn, *args, **kwargs):
+        with self._stats_lock:
+            self._requests += 1
+            if getattr(conn, "sock", None) is None:
+                self._new_connections += 1
+
+        return super()._make_request(conn, *args, **kwargs)
+
+    def statistics(self) -> PoolStatistics:
+        with self._stats_lock:
+            return PoolStatistics(
+                self._requests,
+                self._new_connections,
+                self._requests - self._new_connections,
+                self._wait_time,
+            )
+
+
+_pools = {}
+_pool_configs = {}
+_executors = {}
+_executor_sizes = {}
+_pools_lock = threading.Lock()
+
+
+def configure_pool(chassis: str = None, **settings):
+    """
+    Sets PoolConfig fields for the connection pool of chassis, or the default of all chassis.
+
+    An open pool of the chassis is closed so the next request uses the new settings. Requests
+    that fetched the closed pool are retried on the new one.
+    """
+
+    with _pools_lock:
+        config = _pool_configs.get(chassis, _pool_configs.get(None, PoolConfig()))
+        _pool_configs[chassis] = config._replace(**settings)
+
+        for name in [name for name in _pools if chassis is None or name == chassis]:
+            _pools.pop(name).close()
+
+
+def get_pool(chassis: str) -> _ChassisPool:
+    """
+    Returns the connection pool shared by all sessions to chassis, creating it on first use
+    """
+
+    pool = _pools.get(chassis)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(chassis)
+        if pool is None:
+            config = _pool_configs.get(chassis, _pool_configs.get(None, PoolConfig()))
+            pool = _pools[chassis] = _create_pool(chassis, config)
+
+        return pool
+
+
+def configure_executor(chassis: str, max_concurrency: int):
+    """
+    Sets the number of asyncio requests in flight to chassis across all sessions.
+
+    An open thread pool of the chassis is shut down after its queued requests are sent, and the
+    next request uses a new pool of the given size.
+    """
+
+    with _pools_lock:
+        _executor_sizes[chassis] = max_concurrency
+        executor = _executors.pop(chassis, None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def get_executor(chassis: str, max_concurrency: int = None) -> ThreadPoolExecutor:
+    """
+    Returns the thread pool sending asyncio requests of all sessions to chassis.
+
+    Its size limits the requests in flight to the chassis. It is set by configure_executor, or
+    else by the first session, and defaults to 8. Requesting a different size of an open pool
+    raises ValueError.
+    """
+
+    executor = _executors.get(chassis)
+    if executor is None:
+        with _pools_lock:
+            executor = _executors.get(chassis)
+            if executor is None:
+                size = _executor_sizes.get(chassis, max_concurrency or 8)
+                _executor_sizes[chassis] = size
+                executor = _executors[chassis] = ThreadPoolExecutor(
+                    max_workers=size, thread_name_prefix=f"slsc-{chassis}"
+                )
+
+    if max_concurrency is not None and max_concurrency != _executor_sizes[chassis]:
+        raise ValueError(
+            f"Requests to {chassis} are limited to {_executor_sizes[chassis]}, "
+            "use configure_executor to change the limit"
+        )
+
+    return executor
+
+
+def pool_statistics(chassis: str) -> PoolStatistics:
+    return get_pool(chassis).statistics()
+
+
+def close_pools():
+    """
+    Closes the connection pools and asyncio thread pools of all chassis
+    """
+
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+        for executor in _executors.values():
+            executor.shutdown(wait=False)
+        _executors.clear()
+        _executor_sizes.clear()
+
+
+def _create_pool(chassis: str, config: PoolConfig) -> _ChassisPool:
+    url = urllib3.util.parse_url(f"http://{chassis}")
+
+    socket_options = list(HTTPConnection.default_socket_options)
+    if config.keep_alive_idle is not None:
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            idle = max(int(config.keep_alive_idle), 1)
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+
+    return _ChassisPool(
+        url.host,
+        url.port,
+        maxsize=config.maxsize,
+        block=config.block,
+        timeout=urllib3.Timeout(connect=config.connect_timeout, read=config.read_timeout),
+        socket_options=socket_options,
+    )
+
+
 class JSON_RPC:
     """
     Defines mechanism for sending JSON RPC requests
+
+    Requests are sent over the connection pool shared by all sessions to the chassis.
     """
 
     def __init__(self, chassis: str):
-        self._http = urllib3.PoolManager()
-        self._url = f"http://{chassis}/nislsc/call"
+        self._chassis = chassis
+        self._url = "/nislsc/call"
 
     def query(self, request: Request) -> dict:
-        response = self._http.request("POST", self._url, body=request.serialize())
+        """
+        Sends request and returns its response.
+
+        A response carrying another request's id is replaced by an error, so a response can never
+        be attributed to the wrong request.
+        """
+        if instrumentation.active is not None:
+            return self._query_instrumented(request)
+
+        response = self._post(request.serialize())
+
+        return _check_response(request, json.loads(response.data.decode()))
+
+    def _query_instrumented(self, request: Request) -> dict:
+        """
+        query recording the time spent in each phase of the call to the active metrics
+        """
+        start = time.perf_counter()
+        body = request.serialize().encode()
+        sent = time.perf_counter()
+        try:
+            response = self._post(body)
+        except Exception as error:
+            failed = time.perf_counter()
+            self._record(
+                request._get_method(),
+                (start, sent, failed, failed),
+                len(body),
+                0,
+                (type(error).__name__,),
+            )
+            raise
+        received = time.perf_counter()
+        data = _check_response(request, json.loads(response.data.decode()))
+        parsed = time.perf_counter()
+
+        error = data.get("error")
+        self._record(
+            request._get_method(),
+            (start, sent, received, parsed),
+            len(body),
+            len(response.data),
+            () if error is None else (error.get("code"),),
+        )
 
-        return json.loads(response.data.decode())
+        return data
+
+    def query_batch(self, requests: List[Request]) -> List[dict]:
+        """
+        Sends multiple requests in a single JSON RPC batch.
+
+        Responses are matched to their requests by id and returned in request order.
+        """
+        if not requests:
+            return []
+
+        if instrumentation.active is not None:
+            return self._query_batch_instrumented(requests)
+
+        body = "[" + ", ".join(request.serialize() for request in requests) + "]"
+        response = self._post(body)
+
+        return _match_batch_responses(requests, json.loads(response.data.decode()))
+
+    def _query_batch_instrumented(self, requests: List[Request]) -> List[dict]:
+        """
+        query_batch recording every request of the batch under its own method.
+
+        Each request is recorded with the phase times of the whole batch, its own serialized size
+        and an equal share of the response size.
+        """
+        start = time.perf_counter()
+        serialized = [request.serialize() for request in requests]
+        body = ("[" + ", ".join(serialized) + "]").encode()
+        sent = time.perf_counter()
+        try:
+            response = self._post(body)
+        except Exception as error:
+            failed = time.perf_counter()
+            for request, request_body in zip(requests, serialized):
+                self._record(
+                    request._get_method(),
+                    (start, sent, failed, failed),
+                    len(request_body),
+                    0,
+                    (type(error).__name__,),
+                    "batch",
+                )
+            raise
+        received = time.perf_counter()
+        results = _match_batch_responses(requests, json.loads(response.data.decode()))
+        parsed = time.perf_counter()
+
+        response_bytes = len(response.data) // len(requests)
+        for request, request_body, result in zip(requests, serialized, results):
+            error = result.get("error")
+            self._record(
+                request._get_method(),
+                (start, sent, received, parsed),
+                len(request_body),
+                response_bytes,
+                () if error is None else (error.get("code"),),
+                "batch",
+            )
+
+        return results
+
+    def _post(self, body):
+        try:
+            return get_pool(self._chassis).urlopen("POST", self._url, body=body)
+        except urllib3.exceptions.ClosedPoolError:
+            # configure_pool closed the pool after it was fetched. Nothing was sent on it, so the
+            # request is retried once on the new pool.
+            return get_pool(self._chassis).urlopen("POST", self._url, body=body)
+
+    def _record(
+        self,
+        method: str,
+        times: tuple,
+        request_bytes: int,
+        response_bytes: int,
+        errors: tuple,
+        transport: str = "single",
+    ):
+        metrics = instrumentation.active
+        if metrics is None:
+            return
+
+        start, sent, received, parsed = times
+        metrics.record(
+            instrumentation.CallRecord(
+                self._chassis,
+                method,
+                sent - start,
+                received - sent,
+                parsed - received,
+                request_bytes,
+                response_bytes,
+                errors,
+                transport,
+            )
+        )
 
     def close(self):
-        self._http.clear()
+        """
+        Releases this client. The shared connection pool stays open, see close_pools.
+        """
+
+
+class AsyncJSON_RPC:
+    """
+    Asyncio interface for sending JSON RPC requests
+
+    Requests are sent from a thread pool shared by all asyncio sessions to the chassis, so that
+    many can be awaited from one event loop. At most max_concurrency requests are in flight to the
+    chassis at the same time across those sessions, see get_executor. Use configure_pool to keep
+    as many connections open to the chassis.
+    """
+
+    def __init__(self, chassis: str, max_concurrency: int = None):
+        self._chassis = chassis
+        self._rpc = JSON_RPC(chassis)
+        get_executor(chassis, max_concurrency)
+
+    async def query(self, request: Request) -> dict:
+        loop = asyncio.get_running_loop()
+        executor = get_executor(self._chassis)
+        return await loop.run_in_executor(executor, self._rpc.query, request)
+
+    async def query_batch(self, requests: List[Request]) -> List[dict]:
+        loop = asyncio.get_running_loop()
+        executor = get_executor(self._chassis)
+        return await loop.run_in_executor(executor, self._rpc.query_batch, requests)
+
+    def close(self):
+        """
+        Releases this client. The shared thread pool stays open, see close_pools.
+        """
+        self._rpc.close()
+
+
+def _match_batch_responses(requests: List[Request], data) -> List[dict]:
+    """
+    Orders batch response entries to match the order of the requests.
+
+    A single response object (e.g. invalid batch) is applied to every request and requests without
+    a matching response entry are given an error.
+    """
+    if isinstance(data, dict):
+        return [dict(data, id=request.id) for request in requests]
+
+    by_id = {entry.get("id"): entry for entry in data}
+
+    results = []
+    for request in requests:
+        entry = by_id.get(request.id)
+        if entry is None:
+            entry = _error(request, f"No response for request id {request.id}")
+        results.append(entry)
+
+    return results
+
+
+def _check_response(request: Request, data: dict) -> dict:
+    """
+    Returns data, or an error if it is the response to another request
+    """
+    id = data.get("id")
+    if id != request.id and (id is not None or "error" not in data):
+        return _error(request, f"Response id {id} does not match request id {request.id}")
+
+    return data
+
+
+def _error(request: Request, message: str) -> dict:
+    """
+    Internal error response to request
+    """
+    return {"id": request.id, "jsonrpc": "2.0", "error": {"code": -32603, "message": message}}
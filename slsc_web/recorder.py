@@ -0,0 +1,261 @@
+import hashlib
+import mmap
+import os
+import re
+import struct
+import time
+from array import array
+from typing import Dict, List, Tuple, Union
+from slsc_web.requests import split_resources
+from slsc_web.responses import GetPropertyResponse, PropertyDataType
+
+_TYPECODES = {
+    PropertyDataType.Bool: "?",
+    PropertyDataType.Double: "d",
+    PropertyDataType.Int32: "i",
+    PropertyDataType.Int64: "q",
+    PropertyDataType.Uint32: "I",
+    PropertyDataType.Uint64: "Q",
+}
+
+
+class RingBuffer:
+    """
+    Fixed capacity ring buffer of numbers in preallocated typed memory
+
+    Given a path, the memory is a memory-mapped file instead of process memory. The file starts
+    with a header holding the typecode, capacity, next index and count, so its values can be read
+    back in order with from_file(). An existing file of the same typecode and capacity is resumed
+    instead of overwritten. Once full, appending overwrites the oldest value.
+    """
+
+    _HEADER = struct.Struct("<4s1s3xQQQ")
+    _MAGIC = b"SLRB"
+
+    def __init__(self, typecode: str, capacity: int, path: str = None):
+        size = capacity * array("b" if typecode == "?" else typecode).itemsize
+        self._typecode = typecode
+        self._capacity = capacity
+        self._next = 0
+        self._count = 0
+
+        self._mmap = None
+        if path is not None:
+            header = self._HEADER.size
+            exists = os.path.exists(path) and os.path.getsize(path) > 0
+            with open(path, "r+b" if exists else "w+b") as file:
+                if not exists:
+                    file.truncate(header + size)
+                elif os.path.getsize(path) != header + size:
+                    raise ValueError(f"{path} does not hold a ring buffer of capacity {capacity}")
+                self._mmap = mmap.mmap(file.fileno(), header + size)
+
+            if exists:
+                magic, stored, stored_capacity, self._next, self._count = self._HEADER.unpack_from(
+                    self._mmap
+                )
+                if (magic, stored, stored_capacity) != (self._MAGIC, typecode.encode(), capacity):
+                    self._mmap.close()
+                    raise ValueError(f"{path} does not hold a {typecode} ring buffer")
+            else:
+                self._write_header()
+
+            buffer = memoryview(self._mmap)[header:]
+        else:
+            buffer = bytearray(size)
+
+        self._data = memoryview(buffer).cast(typecode)
+
+    @classmethod
+    def from_file(cls, path: str) -> "RingBuffer":
+        """
+        Opens a ring buffer file written by an earlier run
+        """
+
+        with open(path, "rb") as file:
+            _, typecode, capacity, _, _ = cls._HEADER.unpack(file.read(cls._HEADER.size))
+
+        return cls(typecode.decode(), capacity, path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, value):
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+        if self._mmap is not None:
+            self._write_header()
+
+    def views(self) -> Tuple[memoryview, memoryview]:
+        """
+        Returns stored values oldest first as two zero-copy views
+
+        The second view is empty until the buffer has wrapped around. Views must be released
+        before the buffer is closed.
+        """
+
+        if self._count < self._capacity:
+            return self._data[: self._count], self._data[0:0]
+
+        return self._data[self._next :], self._data[: self._next]
+
+    def tolist(self) -> list:
+        older, newer = self.views()
+        return older.tolist() + newer.tolist()
+
+    def close(self):
+        self._data.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def _write_header(self):
+        self._HEADER.pack_into(
+            self._mmap,
+            0,
+            self._MAGIC,
+            self._typecode.encode(),
+            self._capacity,
+            self._next,
+            self._count,
+        )
+
+
+class Series:
+    """
+    Timestamped values of one property of one resource
+    """
+
+    def __init__(self, data_type: PropertyDataType, capacity: int, path: str = None):
+        typecode = _TYPECODES.get(data_type)
+        if typecode is None:
+            raise ValueError(f"Cannot record properties of data type {data_type.name}")
+
+        self.data_type = data_type
+        self.timestamps = RingBuffer("d", capacity, path and f"{path}.timestamps")
+        self.values = RingBuffer(typecode, capacity, path and f"{path}.values")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, timestamp: float, value):
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+
+    def close(self):
+        self.timestamps.close()
+        self.values.close()
+
+
+class PropertyRecorder:
+    """
+    Records polled property values in fixed size ring buffers, one per property and resource
+
+    Memory use is fixed by capacity, the number of samples kept per series. Given a
+    spill_directory, buffers are memory-mapped files in that directory, named after the property,
+    resource and a digest of both. They keep the latest capacity samples after close and are
+    resumed by a recorder using the same directory.
+    Only scalar numeric and boolean data types can be recorded.
+    """
+
+    def __init__(self, capacity: int, spill_directory: str = None):
+        self._capacity = capacity
+        self._spill_directory = spill_directory
+        self._series = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getitem__(self, key: Tuple[str, str]) -> Series:
+        """
+        Returns series of (property, resource)
+        """
+        return self._series[key]
+
+    def __iter__(self):
+        return iter(self._series)
+
+    def _get_series(self, property: str, resource: str, data_type: PropertyDataType) -> Series:
+        series = self._series.get((property, resource))
+        if series is None:
+            path = None
+            if self._spill_directory is not None:
+                # The digest keeps keys apart whose names only differ in replaced characters
+                digest = hashlib.sha1(f"{property}\0{resource}".encode()).hexdigest()[:8]
+                name = re.sub(r"[^\w.-]", "_", f"{property}_{resource}") + f"_{digest}"
+                path = os.path.join(self._spill_directory, name)
+
+            series = self._series[(property, resource)] = Series(data_type, self._capacity, path)
+
+        return series
+
+    def record(
+        self,
+        property: str,
+        resources: str,
+        data_type: Union[str, PropertyDataType],
+        value,
+        timestamp: float = None,
+    ):
+        """
+        Records value of property read from resources.
+
+        Values read from several resources are lists in resource order.
+        """
+
+        if isinstance(data_type, str):
+            data_type = PropertyDataType[data_type]
+        if timestamp is None:
+            timestamp = time.time()
+
+        resources = split_resources(resources)
+        values = value if len(resources) > 1 else (value,)
+        for resource, resource_value in zip(resources, values):
+            self._get_series(property, resource, data_type).append(timestamp, resource_value)
+
+    def record_response(
+        self, property: str, resources: str, response: GetPropertyResponse, timestamp: float = None
+    ):
+        """
+        Records value of a get_property response, ignoring responses with errors
+        """
+
+        if not response.has_error():
+            self.record(property, resources, response.data_type, response.value, timestamp)
+
+    def poll(self, session, properties: List[str], resources: str = None) -> Dict[str, dict]:
+        """
+        Reads properties from session in one batch and records them.
+
+        Returns errors of properties that could not be read.
+        """
+
+        if resources is None:
+            resources = session._resources
+
+        with session.batch() as batch:
+            pending = [batch.get_property(property, resources) for property in properties]
+
+        timestamp = time.time()
+        errors = {}
+        for property, placeholder in zip(properties, pending):
+            response = placeholder.response
+            if response.has_error():
+                errors[property] = response.error
+            else:
+                self.record(property, resources, response.data_type, response.value, timestamp)
+
+        return errors
+
+    def close(self):
+        for series in self._series.values():
+            series.close()
+        self._series = {}
@@ -0,0 +1,122 @@
+import json
+from typing import Dict, NamedTuple, Union
+
+
+class RegisterAccessError(RuntimeError):
+    """
+    Raised when bulk register access fails
+
+    errors maps each failed address to the error returned by the server.
+    """
+
+    def __init__(self, errors: Dict[int, dict]):
+        self.errors = errors
+        addresses = ", ".join(f"{address:#x}" for address in errors)
+        super().__init__(f"Register access failed at {addresses}")
+
+
+class Field(NamedTuple):
+    """
+    Bit field of a register
+    """
+
+    mask: int
+    shift: int
+
+    def get(self, register_value: int) -> int:
+        return (register_value & self.mask) >> self.shift
+
+    def set(self, register_value: int, value: int) -> int:
+        if value << self.shift & ~self.mask:
+            raise ValueError(f"{value} does not fit field mask {self.mask:#x}")
+        return (register_value & ~self.mask) | (value << self.shift)
+
+
+class Register:
+    """
+    Register of a module with its address, width in bits and named bit fields
+    """
+
+    __slots__ = ("name", "address", "width", "fields")
+
+    def __init__(self, name: str, address: int, width: int, fields: Dict[str, Field]):
+        self.name = name
+        self.address = address
+        self.width = width
+        self.fields = fields
+
+    def __repr__(self) -> str:
+        return f"Register({self.name!r}, {self.address:#x})"
+
+    def get(self, register_value: int, field: str) -> int:
+        return self.fields[field].get(register_value)
+
+    def set(self, register_value: int, **fields: int) -> int:
+        """
+        Returns register_value with given fields replaced
+        """
+        for name, value in fields.items():
+            register_value = self.fields[name].set(register_value, value)
+
+        if register_value >> self.width:
+            raise ValueError(f"{register_value:#x} does not fit {self.width} bit register")
+
+        return register_value
+
+
+class RegisterMap:
+    """
+    Named registers of a module, indexed by name and by address
+
+    Registers are described as {name: {"address": int, "width": int, "fields": {name: mask}}}.
+    Width defaults to 32 bits and addresses and masks may be given as hex strings.
+    """
+
+    def __init__(self, registers: Dict[str, dict]):
+        self._by_name = {}
+        for name, description in registers.items():
+            fields = {
+                field: _field(_number(mask))
+                for field, mask in description.get("fields", {}).items()
+            }
+            register = Register(
+                name, _number(description["address"]), description.get("width", 32), fields
+            )
+            self._by_name[name] = register
+
+        self._by_address = {register.address: register for register in self._by_name.values()}
+
+    @classmethod
+    def load(cls, path: str) -> "RegisterMap":
+        """
+        Loads register map from a JSON file
+        """
+        with open(path) as file:
+            return cls(json.load(file))
+
+    def __getitem__(self, name: str) -> Register:
+        return self._by_name[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self._by_name.values())
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def at(self, address: int) -> Register:
+        """
+        Returns register at address
+        """
+        return self._by_address[address]
+
+
+def _number(value: Union[int, str]) -> int:
+    return int(value, 0) if isinstance(value, str) else value
+
+
+def _field(mask: int) -> Field:
+    shift = (mask & -mask).bit_length() - 1 if mask else 0
+    return Field(mask, shift)
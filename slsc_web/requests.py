@@ -1,6 +1,121 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
+from typing import Iterable, Tuple, Union
 import json
+import re
+
+
+_dumps = json.dumps
+
+
+def set_json_backend(name: str = "json"):
+    """
+    Selects the JSON encoder used to serialize requests: "json" (default) or "orjson".
+
+    orjson is an optional dependency and writes compact JSON without whitespace.
+    """
+
+    global _dumps
+    if name == "json":
+        _dumps = json.dumps
+    elif name == "orjson":
+        import orjson
+
+        def _dumps(data) -> str:
+            return orjson.dumps(data).decode()
+
+    else:
+        raise ValueError(f"Unknown JSON backend {name}")
+
+
+class ResourceSet:
+    """
+    Pre-parsed, immutable set of resource names in order.
+
+    Accepted wherever requests and sessions take comma separated resources, skipping the parsing
+    of the string on every call.
+    """
+
+    __slots__ = ("names", "_index", "_string", "_hash")
+
+    def __init__(self, resources: Union[str, Iterable[str]]):
+        if isinstance(resources, ResourceSet):
+            resources = resources.names
+        elif isinstance(resources, str):
+            resources = resources.split(",")
+        self.names = tuple(dict.fromkeys(resources))
+        self._index = {name: index for index, name in enumerate(self.names)}
+        self._string = ",".join(self.names)
+        self._hash = hash(self.names)
+
+    def __str__(self) -> str:
+        return self._string
+
+    def __repr__(self) -> str:
+        return f"ResourceSet({self._string!r})"
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ResourceSet):
+            return self.names == other.names
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __or__(self, other: Iterable[str]) -> "ResourceSet":
+        return ResourceSet(self.names + tuple(other))
+
+    def index(self, name: str) -> int:
+        return self._index[name]
+
+
+@lru_cache(maxsize=1024)
+def _split(resources: str) -> Tuple[str, ...]:
+    return tuple(resources.split(","))
+
+
+def split_resources(resources: Union[str, ResourceSet]) -> Tuple[str, ...]:
+    """
+    Splits comma separated resources, caching the result for repeated resource strings.
+    ResourceSets are already split.
+    """
+    if isinstance(resources, ResourceSet):
+        return resources.names
+    return _split(resources)
+
+
+_RANGE = re.compile(r"^(.*?)(\d+):(\d+)$")
+
+
+@lru_cache(maxsize=1024)
+def expand_channels(channels: str) -> Tuple[str, ...]:
+    """
+    Expands comma separated resources with trailing index ranges, such as "Mod1/ch0:3" to
+    Mod1/ch0, Mod1/ch1, Mod1/ch2 and Mod1/ch3. Ranges are inclusive and may count down.
+    """
+
+    expanded = []
+    for resource in split_resources(channels):
+        match = _RANGE.match(resource)
+        if match is None:
+            expanded.append(resource)
+            continue
+
+        prefix, first, last = match.group(1), int(match.group(2)), int(match.group(3))
+        step = 1 if last >= first else -1
+        expanded.extend(f"{prefix}{index}" for index in range(first, last + step, step))
+
+    return tuple(expanded)
 
 
 class AccessType(Enum):
@@ -28,8 +143,15 @@ class Request(ABC):
         """
         return ""
 
+    @property
+    def id(self) -> str:
+        """
+        ID of the request, as sent to the server
+        """
+        return self._request_dict["id"]
+
     def serialize(self) -> str:
-        return json.dumps(self._request_dict)
+        return _dumps(self._request_dict)
 
     def _initialize_parameters(
         self,
@@ -38,11 +160,11 @@ class Request(ABC):
         nvmem_areas: str = None,
     ) -> dict:
         if devices is not None:
-            return {"devices": devices.split(",")}
+            return {"devices": split_resources(devices)}
         elif physical_channels is not None:
-            return {"physical_channels": physical_channels.split(",")}
+            return {"physical_channels": split_resources(physical_channels)}
         else:  # TODO: need to think about case where they are all None
-            return {"nvmem_areas": nvmem_areas.split(",")}
+            return {"nvmem_areas": split_resources(nvmem_areas)}
 
 
 class InitializeRequest(Request):
@@ -153,7 +275,7 @@ class ConnectToDevicesRequest(Request):
     """
 
     def __init__(self, id: int, session_id: str, devices: str):
-        params = {"session_id": session_id, "devices": devices.split(",")}
+        params = {"session_id": session_id, "devices": split_resources(devices)}
         super().__init__(id, params)
 
     def _get_method(self) -> str:
@@ -166,7 +288,7 @@ class DisconnectFromDevicesRequest(Request):
     """
 
     def __init__(self, id: int, session_id: str, devices: str):
-        params = {"session_id": session_id, "devices": devices.split(",")}
+        params = {"session_id": session_id, "devices": split_resources(devices)}
         super().__init__(id, params)
 
     def _get_method(self) -> str:
@@ -179,7 +301,7 @@ class ResetDevicesRequest(Request):
     """
 
     def __init__(self, id: int, session_id: str, devices: str):
-        params = {"session_id": session_id, "devices": devices.split(",")}
+        params = {"session_id": session_id, "devices": split_resources(devices)}
         super().__init__(id, params)
 
     def _get_method(self) -> str:
@@ -215,7 +337,7 @@ class ReserveDeviceRequest(Request):
     ):
         params = {
             "session_id": session_id,
-            "devices": devices.split(","),
+            "devices": split_resources(devices),
             "access": access.name,
             "reservation_group": reservation_group,
             "reservation_timeout": reservation_timeout,
@@ -232,7 +354,7 @@ class UnreserveDevicesRequest(Request):
     """
 
     def __init__(self, id: int, session_id: str, devices: str):
-        params = {"session_id": session_id, "devices": devices.split(",")}
+        params = {"session_id": session_id, "devices": split_resources(devices)}
         super().__init__(id, params)
 
     def _get_method(self) -> str:
@@ -258,6 +380,7 @@ class CommitPropertiesRequest(Request):
     def _get_method(self) -> str:
         return "commitProperties"
 
+
 class GetPropertyInformationRequest(Request):
     """
     Gets all information of a property
@@ -280,6 +403,195 @@ class GetPropertyInformationRequest(Request):
     def _get_method(self) -> str:
         return "getPropertyInformation"
 
+
+class SetPropertyRequest(Request):
+    """
+    Sets property of devices, physical channels, or nvmem areas to value
+    """
+
+    def __init__(
+        self,
+        id: int,
+        session_id: str,
+        property: str,
+        value,
+        devices: str = None,
+        physical_channels: str = None,
+        nvmem_areas: str = None,
+    ):
+        params = self._initialize_parameters(devices, physical_channels, nvmem_areas)
+        params["session_id"] = session_id
+        params["property"] = property
+        params["value"] = value
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "setProperty"
+
+
+class ReadRegisterRequest(Request):
+    """
+    Reads value of a register of a device
+    """
+
+    def __init__(self, id: int, session_id: str, device: str, address: int):
+        params = {"session_id": session_id, "device": device, "address": address}
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "readRegister"
+
+
+class WriteRegisterRequest(Request):
+    """
+    Writes value to a register of a device
+    """
+
+    def __init__(self, id: int, session_id: str, device: str, address: int, value: int):
+        params = {"session_id": session_id, "device": device, "address": address, "value": value}
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "writeRegister"
+
+
+class GetNvmemBytesRequest(Request):
+    """
+    Reads count bytes of an nvmem area starting at offset
+    """
+
+    def __init__(self, id: int, session_id: str, nvmem_area: str, offset: int, count: int):
+        params = {
+            "session_id": session_id,
+            "nvmem_area": nvmem_area,
+            "offset": offset,
+            "count": count,
+        }
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "getNvmemBytes"
+
+
+class SetNvmemBytesRequest(Request):
+    """
+    Writes bytes to an nvmem area starting at offset
+
+    Changes are stored in nvmem once committed with commitNvmemAreas.
+    """
+
+    def __init__(self, id: int, session_id: str, nvmem_area: str, offset: int, data: bytes):
+        params = {
+            "session_id": session_id,
+            "nvmem_area": nvmem_area,
+            "offset": offset,
+            "bytes": list(data),
+        }
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "setNvmemBytes"
+
+
+class CommitNvmemAreasRequest(Request):
+    """
+    Commits pending changes of nvmem areas to the module
+    """
+
+    def __init__(self, id: int, session_id: str, nvmem_areas: str):
+        params = {"session_id": session_id, "nvmem_areas": split_resources(nvmem_areas)}
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "commitNvmemAreas"
+
+
+class GetCommandListRequest(Request):
+    """
+    Lists all commands of a device
+    """
+
+    def __init__(self, id: int, session_id: str, device: str):
+        params = {"session_id": session_id, "device": device}
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "getCommandList"
+
+
+class GetCommandInformationRequest(Request):
+    """
+    Gets all information of a command of a device
+    """
+
+    def __init__(self, id: int, session_id: str, device: str, command: str):
+        params = {"session_id": session_id, "device": device, "command": command}
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "getCommandInformation"
+
+
+class ExecuteCommandRequest(Request):
+    """
+    Executes a command on devices
+    """
+
+    def __init__(self, id: int, session_id: str, command: str, devices: str):
+        params = {
+            "session_id": session_id,
+            "devices": split_resources(devices),
+            "command": command,
+        }
+        super().__init__(id, params)
+
+    def _get_method(self) -> str:
+        return "executeCommand"
+
+
+class RequestTemplate:
+    """
+    Pre-serialized request for sending the same request repeatedly
+
+    The body is encoded once and only the id is spliced in for each request.
+    """
+
+    _ID_MARKER = "__slsc_request_id__"
+
+    def __init__(self, request: Request):
+        self.method = request._get_method()
+
+        body = _dumps(dict(request._request_dict, id=self._ID_MARKER))
+        self._prefix, self._suffix = body.split(f'"{self._ID_MARKER}"')
+
+    def serialize(self, id: int) -> str:
+        return f'{self._prefix}"{id}"{self._suffix}'
+
+    def bind(self, id: int) -> "TemplatedRequest":
+        """
+        Creates request with given id
+        """
+        return TemplatedRequest(self, id)
+
+
+class TemplatedRequest:
+    """
+    Request created from a RequestTemplate
+    """
+
+    __slots__ = ("_template", "id")
+
+    def __init__(self, template: RequestTemplate, id: int):
+        self._template = template
+        self.id = str(id)
+
+    def _get_method(self) -> str:
+        return self._template.method
+
+    def serialize(self) -> str:
+        return self._template.serialize(self.id)
+
+
 if __name__ == "__main__":
     init = InitializeRequest(4, "SLSC-12201")
     print(init.serialize())
@@ -1,5 +1,4 @@
 from enum import Enum
-from typing import List
 
 
 class PropertyDataType(Enum):
@@ -20,19 +19,69 @@ class PropertyDataType(Enum):
     Uint64Array = 14
 
 
+class _ResultField:
+    """
+    Response attribute decoded from the result of the response on first access
+
+    Responses with an error return default instead. The decoded value is stored on the response,
+    like values assigned to the attribute, so later accesses return the same object.
+    """
+
+    def __init__(self, result: str, default=None, convert=None, doc: str = None):
+        self._result = result
+        self._default = default
+        self._convert = convert
+        self.__doc__ = doc
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(self, response, owner: type = None):
+        if response is None:
+            return self
+
+        assigned = response._assigned
+        if assigned is not None and self._name in assigned:
+            return assigned[self._name]
+
+        result = response._result
+        if result is None:
+            value = self._default() if callable(self._default) else self._default
+        else:
+            value = result.get(self._result)
+
+        if self._convert:
+            value = self._convert(value)
+
+        if assigned is None:
+            assigned = response._assigned = {}
+        assigned[self._name] = value
+
+        return value
+
+    def __set__(self, response, value):
+        if response._assigned is None:
+            response._assigned = {}
+
+        response._assigned[self._name] = self._convert(value) if self._convert else value
+
+
 class GenericResponse:
 
     """
     Generic Response object for SLSC Web responses that don't return data
+
+    Result fields of subclasses are decoded from the parsed response when accessed.
     """
 
-    def __init__(self, data: dict):
-        self.id = data.get("id")
-        self.rpc_version = data.get("jsonrpc")
-        self.error = data.get("error")
+    __slots__ = ("_id", "_rpc_version", "_error", "_result", "_assigned")
 
-        if not self.has_error():
-            self._read_results(data)
+    def __init__(self, data: dict):
+        self._id = data.get("id")
+        self._rpc_version = data.get("jsonrpc")
+        self._error = data.get("error")
+        self._result = data.get("result") if self._error is None else None
+        self._assigned = None
 
     @property
     def id(self) -> int:
@@ -69,23 +118,11 @@ class GenericResponse:
         self._error = error
 
     def has_error(self):
-        if self.error is None:
+        if self._error is None:
             return False
         else:
             return True
 
-    def _read_results(self, data: dict):
-        """
-        Adds results from data input to Reponse object data
-        """
-        pass
-
-    def _get_result(self, data: dict, result: str):
-        """
-        Gets single result from response dictionary
-        """
-        return data.get("result").get(result)
-
 
 class InitializeResponse(GenericResponse):
 
@@ -93,23 +130,9 @@ class InitializeResponse(GenericResponse):
     Response of initializeSession request
     """
 
-    def __init__(self, data: dict):
-        self.session_id = ""
-        super().__init__(data)
-
-    @property
-    def session_id(self) -> str:
-        """
-        ID of the session
-        """
-        return self._session_id
-
-    @session_id.setter
-    def session_id(self, id: str):
-        self._session_id = id
+    __slots__ = ()
 
-    def _read_results(self, data: dict):
-        self.session_id = self._get_result(data, "session_id")
+    session_id = _ResultField("session_id", "", doc="ID of the session")
 
 
 class GetPropertyListResponse(GenericResponse):
@@ -118,30 +141,10 @@ class GetPropertyListResponse(GenericResponse):
     Response of getDevicePropertyList request
     """
 
-    def __init__(self, data: dict):
-        self.static_properties = []
-        self.dynamic_properties = []
-        super().__init__(data)
-
-    @property
-    def static_properties(self) -> List[str]:
-        return self._static_properties
-
-    @static_properties.setter
-    def static_properties(self, properties: List[str]):
-        self._static_properties = properties
-
-    @property
-    def dynamic_properties(self) -> List[str]:
-        return self._dynamic_properties
-
-    @dynamic_properties.setter
-    def dynamic_properties(self, properties: List[str]):
-        self._dynamic_properties = properties
+    __slots__ = ()
 
-    def _read_results(self, data: dict):
-        self.static_properties = self._get_result(data, "static_properties")
-        self.dynamic_properties = self._get_result(data, "dynamic_properties")
+    static_properties = _ResultField("static_properties", list)
+    dynamic_properties = _ResultField("dynamic_properties", list)
 
 
 class GetSessionPropertyListResponse(GenericResponse):
@@ -150,20 +153,9 @@ class GetSessionPropertyListResponse(GenericResponse):
     Response of getSessionPropertyList request
     """
 
-    def __init__(self, data: dict):
-        self.properties = []
-        super().__init__(data)
-
-    @property
-    def properties(self) -> List[str]:
-        return self._static_properties
+    __slots__ = ()
 
-    @properties.setter
-    def properties(self, properties: List[str]):
-        self._static_properties = properties
-
-    def _read_results(self, data: dict):
-        self.properties = self._get_result(data, "properties")
+    properties = _ResultField("properties", list)
 
 
 class GetPropertyResponse(GenericResponse):
@@ -172,135 +164,81 @@ class GetPropertyResponse(GenericResponse):
     Response of getProperty request
     """
 
-    def __init__(self, data: dict):
-        self.data_type = ""
-        self.value = None
-        super().__init__(data)
+    __slots__ = ()
 
-    @property
-    def data_type(self) -> str:
-        return self._data_type
+    data_type = _ResultField("data_type", "")
+    value = _ResultField("value")
 
-    @data_type.setter
-    def data_type(self, type: str):
-        self._data_type = type
 
-    @property
-    def value(self):
-        return self._value
+class GetPropertyInformationResponse(GenericResponse):
 
-    @value.setter
-    def value(self, value):
-        self._value = value
+    """
+    Response of getPropertyInformation request
+    """
 
-    def _read_results(self, data: dict):
-        self.data_type = self._get_result(data, "data_type")
-        self.value = self._get_result(data, "value")
+    __slots__ = ()
 
+    description = _ResultField("description", "", doc="Concise description of the property")
+    documentation = _ResultField("documentation", "", doc="Optional documentation of the proeprty")
+    data_type = _ResultField(
+        "data_type",
+        "Unknown",
+        lambda data_type: PropertyDataType[data_type],
+        doc="Indicates data type of the property",
+    )
+    access = _ResultField(
+        "access",
+        "",
+        doc="Property access mode\n\n(0) None, (1) Read-Only, (2) Write-Only, (3) Read/Write",
+    )
+    unit = _ResultField("unit", "", doc="Unit of the property")
+    minimum_value = _ResultField("min_value", doc="Minimum value of the property")
+    maximum_value = _ResultField("max_value", doc="Maximum value of the property")
 
-class GetPropertyInformationResponse(GenericResponse):
+
+class ReadRegisterResponse(GenericResponse):
 
     """
-    Response of getPropertyInformation request
+    Response of readRegister request
     """
 
-    def __init__(self, data: dict):
-        self.description = ""
-        self.documentation = ""
-        self.data_type = "Unknown"
-        self.access = ""
-        self.unit = ""
-        self.minimum_value = None
-        self.maximum_value = None
-        super().__init__(data)
-
-    def _read_results(self, data: dict):
-        self.description = self._get_result(data, "description")
-        self.documentation = self._get_result(data, "documentation")
-        self.data_type = self._get_result(data, "data_type")
-        self.access = self._get_result(data, "access")
-        self.unit = self._get_result(data, "unit")
-        self.minimum_value = self._get_result(data, "min_value")
-        self.maximum_value = self._get_result(data, "max_value")
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        """
-        Concise description of the property
-        """
-        return self._description
+    value = _ResultField("value", doc="Value of the register")
 
-    @description.setter
-    def description(self, description: str):
-        self._description = description
 
-    @property
-    def documentation(self) -> str:
-        """
-        Optional documentation of the proeprty
-        """
-        return self._documentation
+class GetNvmemBytesResponse(GenericResponse):
+
+    """
+    Response of getNvmemBytes request
+    """
 
-    @documentation.setter
-    def documentation(self, documentation: str):
-        self._documentation = documentation
+    __slots__ = ()
 
-    @property
-    def data_type(self) -> PropertyDataType:
-        """
-        Indicates data type of the property
-        """
-        return self._data_type
+    data = _ResultField("bytes", list, doc="Bytes read from the nvmem area")
 
-    @data_type.setter
-    def data_type(self, data_type: PropertyDataType):
-        self._data_type = PropertyDataType[data_type]
 
-    @property
-    def access(self) -> str:
-        """
-        Property access mode
+class GetCommandListResponse(GenericResponse):
 
-        (0) None, (1) Read-Only, (2) Write-Only, (3) Read/Write
-        """
-        return self._access
+    """
+    Response of getCommandList request
+    """
 
-    @access.setter
-    def access(self, access):
-        self._access = access
+    __slots__ = ()
 
-    @property
-    def unit(self) -> str:
-        """
-        Unit of the property
-        """
-        return self._unit
+    commands = _ResultField("commands", list, doc="Names of the commands of the device")
 
-    @unit.setter
-    def unit(self, unit: str):
-        self._unit = unit
 
-    @property
-    def minimum_value(self):
-        """
-        Minimum value of the property
-        """
-        return self._min_value
+class GetCommandInformationResponse(GenericResponse):
 
-    @minimum_value.setter
-    def minimum_value(self, min_value):
-        self._min_value = min_value
+    """
+    Response of getCommandInformation request
+    """
 
-    @property
-    def maximum_value(self):
-        """
-        Maximum value of the property
-        """
-        return self._max_value
+    __slots__ = ()
 
-    @maximum_value.setter
-    def maximum_value(self, max_value):
-        self._max_value = max_value
+    description = _ResultField("description", "", doc="Concise description of the command")
+    documentation = _ResultField("documentation", "", doc="Optional documentation of the command")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,17 @@
 from abc import ABC, abstractmethod
+import itertools
+import threading
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Tuple, Union
 from slsc_web.requests import *
 from slsc_web.responses import *
 from slsc_web.protocols import JSON_RPC
+from slsc_web.cache import MetadataCache, ValueCache
+from slsc_web import arrays
+from slsc_web.monitor import PropertyMonitor
+from slsc_web.validation import validate_writes
+from slsc_web.registers import Register, RegisterAccessError
 
 
 class SLSC_Session(ABC):
@@ -9,11 +19,19 @@ class SLSC_Session(ABC):
     Parent class to all SLSC devices, physical channels, or NVMEM areas.
     """
 
-    def __init__(self, chassis: str, resources: str):
+    def __init__(
+        self, chassis: str, resources: Union[str, ResourceSet], metadata_cache: MetadataCache = None
+    ):
         self._rpc = JSON_RPC(chassis)
-        self._uid = 0
+        self._chassis = chassis
+        self._metadata_cache = metadata_cache
+        self._identities = {}
+        self._templates = {}
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._uid = itertools.count(1)
         self._session_id = ""
-        self._resources = resources
+        self._resources = ResourceSet(resources)
 
         response = self.initialize(resources)
         if response.has_error():
@@ -27,6 +45,8 @@ class SLSC_Session(ABC):
     def __exit__(self, *args):
         self.close()
         self._rpc.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
 
     @abstractmethod
     def initialize(self, resources: str) -> InitializeResponse:
@@ -48,6 +68,138 @@ class SLSC_Session(ABC):
     def _query(self, request: Request) -> dict:
         return self._rpc.query(request)
 
+    def _query_batch(self, requests: List[Request]) -> List[dict]:
+        return self._rpc.query_batch(requests)
+
+    def _submit(self, request: Request, response_type: type) -> Future:
+        """
+        Sends request from a thread pool, returning a future of its response
+        """
+
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(thread_name_prefix=f"slsc-{self._chassis}")
+
+        return self._executor.submit(lambda: response_type(self._query(request)))
+
+    def _get_template(self, key: tuple, create_request: Callable[[], Request]) -> RequestTemplate:
+        """
+        Returns template for a request that is sent repeatedly, creating it on first use
+        """
+
+        template = self._templates.get(key)
+        if template is None:
+            if len(self._templates) >= 256:
+                self._templates.clear()
+            template = self._templates[key] = RequestTemplate(create_request())
+
+        return template
+
+    def _query_cached(
+        self,
+        key: tuple,
+        create_request: Callable[[], Request],
+        response_type: type,
+        by_module: bool = False,
+    ) -> GenericResponse:
+        """
+        Queries metadata through the metadata cache and its disk store, if configured.
+
+        key must end with the tuple of resources the request refers to. With by_module, responses
+        are also cached in memory by module model and firmware, so that identical modules on any
+        chassis share one copy even without a disk store.
+        """
+
+        cache = self._metadata_cache
+        if cache is None:
+            return response_type(self._query(create_request()))
+
+        response = cache.get(self._chassis, key)
+        if response is not None:
+            return response
+
+        identity = None
+        if cache.store is not None or by_module:
+            identity = self._get_identity(key[-1])
+
+        module_key = (*identity, *key[:-1], ()) if by_module and identity is not None else None
+        if module_key is not None:
+            response = cache.get(None, module_key)
+            if response is not None:
+                cache.put(self._chassis, key, response)
+                return response
+
+        data = None
+        if identity is not None and cache.store is not None:
+            data = cache.store.get(*identity, key[:-1])
+
+        if data is None:
+            data = self._query(create_request())
+            if identity is not None and cache.store is not None and "error" not in data:
+                cache.store.put(*identity, key[:-1], data)
+
+        response = response_type(data)
+        if not response.has_error():
+            cache.put(self._chassis, key, response)
+            if module_key is not None:
+                cache.put(None, module_key, response)
+
+        return response
+
+    def _get_identity(self, resources: tuple) -> tuple:
+        """
+        Returns (model, firmware) shared by all resources, or None if unknown or not shared
+        """
+
+        missing = [resource for resource in resources if resource not in self._identities]
+        if missing:
+            cache = self._metadata_cache
+            source = cache.store if cache.store is not None else cache
+            requests = []
+            for resource in missing:
+                for property in (source.model_property, source.firmware_property):
+                    requests.append(
+                        GetPropertyRequest(
+                            self._get_uid(), self._session_id, property, devices=resource
+                        )
+                    )
+
+            results = [GetPropertyResponse(data) for data in self._query_batch(requests)]
+            for index, resource in enumerate(missing):
+                model, firmware = results[2 * index : 2 * index + 2]
+                if model.has_error() or firmware.has_error():
+                    self._identities[resource] = None
+                else:
+                    self._identities[resource] = (str(model.value), str(firmware.value))
+
+        identities = {self._identities[resource] for resource in resources}
+        return identities.pop() if len(identities) == 1 else None
+
+    def _invalidate_cached(self, resources: str = None):
+        """
+        Drops cached metadata of given resources, or of the whole chassis if resources is None
+        """
+
+        if resources is None:
+            self._identities.clear()
+        else:
+            for resource in split_resources(resources):
+                self._identities.pop(resource, None)
+
+        if self._metadata_cache is not None:
+            resources = split_resources(resources) if resources is not None else None
+            self._metadata_cache.invalidate(self._chassis, resources)
+
+    def batch(self, max_size: int = None) -> "Batch":
+        """
+        Creates a batch that sends queued requests together in as few round trips as possible.
+
+        max_size limits the number of requests sent in a single HTTP request.
+        """
+
+        return Batch(self, max_size)
+
     def close(self) -> GenericResponse:
         """
         Closes any open SLSC references
@@ -84,6 +236,7 @@ class SLSC_Session(ABC):
 
         request = ConnectToDevicesRequest(self._get_uid(), self._session_id, devices)
         response = self._query(request)
+        self._invalidate_cached(devices)
 
         return GenericResponse(response)
 
@@ -104,11 +257,11 @@ class SLSC_Session(ABC):
 
     def _get_uid(self) -> int:
         """
-        Returns incrementing unique ID starting at 1
+        Returns incrementing unique ID starting at 1.
+        Safe to call from several threads, as advancing itertools.count is atomic.
         """
 
-        self._uid += 1
-        return self._uid
+        return next(self._uid)
 
     def get_session_properties(self) -> GetSessionPropertyListResponse:
         """
@@ -127,8 +280,35 @@ class Device(SLSC_Session):
     Used to query and command SLSC chassis/modules
     """
 
-    def __init__(self, chassis: str, devices: str):
-        super().__init__(chassis, devices)
+    def __init__(
+        self,
+        chassis: str,
+        devices: str,
+        metadata_cache: MetadataCache = None,
+        value_cache: ValueCache = None,
+        numpy_values: bool = False,
+    ):
+        """
+        Passing a metadata_cache caches results of get_property_list, get_property_information,
+        get_command_list and get_command_information. The cache may be shared between sessions,
+        and a cache with a DiskMetadataStore also persists the metadata between processes.
+        Without a metadata_cache every call queries the chassis.
+
+        Passing a value_cache serves get_property of static properties from memory after the
+        first read. Dynamic properties are always read from the chassis.
+
+        numpy_values decodes get_property values to NumPy arrays typed by their data type
+        (requires numpy).
+        """
+        if numpy_values:
+            arrays.require_numpy()
+
+        self._property_response = (
+            arrays.NumpyGetPropertyResponse if numpy_values else GetPropertyResponse
+        )
+        self._value_cache = value_cache
+        self._static_properties = {}
+        super().__init__(chassis, devices, metadata_cache)
 
     def initialize(self, resources: str) -> InitializeResponse:
         """
@@ -147,21 +327,152 @@ class Device(SLSC_Session):
         """
 
         if resource is None:  # set resource to first resource
-            resource = self._resources.split(",")[0]
-
-        request = GetDevicePropertyListRequest(self._get_uid(), self._session_id, resource)
-        response = self._query(request)
+            resource = split_resources(self._resources)[0]
 
-        return GetPropertyListResponse(response)
+        return self._query_cached(
+            ("getDevicePropertyList", (resource,)),
+            lambda: GetDevicePropertyListRequest(self._get_uid(), self._session_id, resource),
+            GetPropertyListResponse,
+        )
 
     def get_property(self, property: str, resources: str = None) -> GetPropertyResponse:
         if resources is None:
             resources = self._resources
 
-        request = GetPropertyRequest(self._get_uid(), self._session_id, property, devices=resources)
+        template = self._get_template(
+            ("getProperty", property, resources),
+            lambda: GetPropertyRequest(0, self._session_id, property, devices=resources),
+        )
+
+        if self._value_cache is None or not self._is_static(property, resources):
+            return self._property_response(self._query(template.bind(self._get_uid())))
+
+        key = ("getProperty", property, split_resources(resources))
+        response = self._value_cache.get(self._chassis, key)
+        if response is None:
+            response = self._property_response(self._query(template.bind(self._get_uid())))
+            if not response.has_error():
+                self._value_cache.put(self._chassis, key, response)
+
+        return response
+
+    def _is_static(self, property: str, resources: str) -> bool:
+        """
+        True if property is static on all resources
+        """
+
+        for resource in split_resources(resources):
+            static = self._static_properties.get(resource)
+            if static is None:
+                response = self.get_property_list(resource)
+                if response.has_error():
+                    return False
+                static = self._static_properties[resource] = frozenset(response.static_properties)
+
+            if property not in static:
+                return False
+
+        return True
+
+    def _invalidate_values(self, resources: str = None):
+        """
+        Drops cached values of given resources, or of the whole chassis if resources is None
+        """
+
+        if resources is None:
+            self._static_properties.clear()
+
+        if self._value_cache is not None:
+            resources = split_resources(resources) if resources is not None else None
+            self._value_cache.invalidate(self._chassis, resources)
+
+    def monitor(
+        self,
+        properties: Union[str, List[str]],
+        resources: str = None,
+        rate: float = 1.0,
+        change_only: bool = False,
+    ) -> PropertyMonitor:
+        """
+        Reads properties at rate samples per second, yielding a MonitorSample per tick.
+
+        All properties are read in a single batch per tick. Ticks the chassis could not keep up
+        with are skipped and reported in the missed count of the next sample.
+        With change_only, only values that changed since the previous sample are yielded.
+        """
+
+        return PropertyMonitor(self, properties, resources, rate, change_only)
+
+    def set_property(
+        self, property: str, value, resources: str = None, validate: bool = False
+    ) -> GenericResponse:
+        """
+        Sets property to value.
+
+        Leaving resources empty will use the resources opened with this session.
+        Dynamic properties take effect once committed with commit_properties.
+        With validate, the value is checked against the property information before sending and
+        PropertyValidationError is raised if it is invalid.
+        """
+
+        if resources is None:
+            resources = self._resources
+
+        if validate:
+            validate_writes(self, [(property, value, resources)])
+
+        request = SetPropertyRequest(
+            self._get_uid(), self._session_id, property, value, devices=resources
+        )
         response = self._query(request)
+        self._invalidate_values(resources)
+
+        return GenericResponse(response)
+
+    def write_buffer(
+        self,
+        commit: bool = True,
+        max_size: int = None,
+        validate: bool = False,
+        coerce: bool = False,
+    ) -> "WriteBuffer":
+        """
+        Creates a buffer staging property writes that are sent together.
+
+        See WriteBuffer.
+        """
 
-        return GetPropertyResponse(response)
+        return WriteBuffer(self, commit, max_size, validate, coerce)
+
+    def get_property_information_batch(
+        self, properties: List[Tuple[str, str]]
+    ) -> List[GetPropertyInformationResponse]:
+        """
+        Gets information of many (property, resources) pairs in a single batch.
+
+        Pairs found in the metadata cache are not sent.
+        """
+
+        keys = [
+            ("getPropertyInformation", property, split_resources(resources))
+            for property, resources in properties
+        ]
+        cache = self._metadata_cache
+        responses = [cache.get(self._chassis, key) if cache else None for key in keys]
+
+        batch = self.batch()
+        pending = {}
+        for index, (property, resources) in enumerate(properties):
+            if responses[index] is None:
+                pending[index] = batch.get_property_information(property, resources)
+        batch.send()
+
+        for index, placeholder in pending.items():
+            responses[index] = placeholder.response
+            if cache is not None and not placeholder.response.has_error():
+                cache.put(self._chassis, keys[index], placeholder.response)
+
+        return responses
 
     def get_property_information(
         self, property: str, resources: str = None
@@ -174,12 +485,209 @@ class Device(SLSC_Session):
         if resources is None:
             resources = self._resources
 
-        request = GetPropertyInformationRequest(
-            self._get_uid(), self._session_id, property, devices=resources
+        return self._query_cached(
+            ("getPropertyInformation", property, split_resources(resources)),
+            lambda: GetPropertyInformationRequest(
+                self._get_uid(), self._session_id, property, devices=resources
+            ),
+            GetPropertyInformationResponse,
         )
+
+    def read_register(self, address: int, device: str = None) -> ReadRegisterResponse:
+        """
+        Reads register at address of device.
+        No input device will use the first resource in session.
+        """
+
+        if device is None:
+            device = split_resources(self._resources)[0]
+
+        request = ReadRegisterRequest(self._get_uid(), self._session_id, device, address)
         response = self._query(request)
 
-        return GetPropertyInformationResponse(response)
+        return ReadRegisterResponse(response)
+
+    def write_register(self, address: int, value: int, device: str = None) -> GenericResponse:
+        """
+        Writes value to register at address of device.
+        No input device will use the first resource in session.
+        """
+
+        if device is None:
+            device = split_resources(self._resources)[0]
+
+        request = WriteRegisterRequest(self._get_uid(), self._session_id, device, address, value)
+        response = self._query(request)
+
+        return GenericResponse(response)
+
+    def read_registers(
+        self, addresses: Iterable[int], device: str = None, max_size: int = None
+    ) -> array:
+        """
+        Reads many registers of device in as few round trips as possible.
+
+        Returns values as an array of unsigned 64-bit integers in address order, or raises
+        RegisterAccessError listing every address that could not be read.
+        """
+
+        if device is None:
+            device = split_resources(self._resources)[0]
+
+        addresses = list(addresses)
+        batch = self.batch(max_size)
+        for address in addresses:
+            request = ReadRegisterRequest(self._get_uid(), self._session_id, device, address)
+            batch.add(request, ReadRegisterResponse)
+        responses = batch.send()
+
+        errors = {
+            address: response.error
+            for address, response in zip(addresses, responses)
+            if response.has_error()
+        }
+        if errors:
+            raise RegisterAccessError(errors)
+
+        return array("Q", (response.value for response in responses))
+
+    def write_registers(
+        self, values: Dict[int, int], device: str = None, max_size: int = None
+    ) -> List[GenericResponse]:
+        """
+        Writes many registers of device, given as {address: value}, in as few round trips as
+        possible. Raises RegisterAccessError listing every address that could not be written.
+        """
+
+        if device is None:
+            device = split_resources(self._resources)[0]
+
+        batch = self.batch(max_size)
+        for address, value in values.items():
+            request = WriteRegisterRequest(
+                self._get_uid(), self._session_id, device, address, value
+            )
+            batch.add(request)
+        responses = batch.send()
+
+        errors = {
+            address: response.error
+            for address, response in zip(values, responses)
+            if response.has_error()
+        }
+        if errors:
+            raise RegisterAccessError(errors)
+
+        return responses
+
+    def update_registers(
+        self, updates: Dict[Register, Dict[str, int]], device: str = None
+    ) -> Dict[Register, int]:
+        """
+        Read-modify-writes fields of registers, e.g. {regmap["CTRL"]: {"EN": 1}}.
+
+        All registers are read in one batch and only registers whose value changes are written,
+        in a second batch. Returns the new value of every register.
+        """
+
+        registers = list(updates)
+        current = self.read_registers([register.address for register in registers], device)
+
+        values = {}
+        changed = {}
+        for register, value in zip(registers, current):
+            values[register] = register.set(value, **updates[register])
+            if values[register] != value:
+                changed[register.address] = values[register]
+
+        if changed:
+            self.write_registers(changed, device)
+
+        return values
+
+    def update_register(self, register: Register, device: str = None, **fields: int) -> int:
+        """
+        Read-modify-writes fields of a register, skipping the write if the value is unchanged.
+        Returns the new value of the register.
+        """
+
+        return self.update_registers({register: fields}, device)[register]
+
+    def get_command_list(self, device: str = None) -> GetCommandListResponse:
+        """
+        Lists commands of given device.
+        No input device will use the first resource in session.
+
+        Caching is opt-in: only sessions given a metadata_cache cache results, per module model
+        and firmware, so that identical modules share one copy. Otherwise every call queries the
+        chassis.
+        """
+
+        if device is None:
+            device = split_resources(self._resources)[0]
+
+        return self._query_cached(
+            ("getCommandList", (device,)),
+            lambda: GetCommandListRequest(self._get_uid(), self._session_id, device),
+            GetCommandListResponse,
+            by_module=True,
+        )
+
+    def get_command_information(
+        self, command: str, device: str = None
+    ) -> GetCommandInformationResponse:
+        """
+        Gets all information of a command of given device.
+        No input device will use the first resource in session.
+
+        Cached per module model and firmware like get_command_list, if the session has a
+        metadata cache.
+        """
+
+        if device is None:
+            device = split_resources(self._resources)[0]
+
+        return self._query_cached(
+            ("getCommandInformation", command, (device,)),
+            lambda: GetCommandInformationRequest(
+                self._get_uid(), self._session_id, device, command
+            ),
+            GetCommandInformationResponse,
+            by_module=True,
+        )
+
+    def execute_command(self, command: str, devices: str = None) -> GenericResponse:
+        """
+        Executes command on devices, blocking until it completes.
+
+        By default, the command is executed on the session devices
+        """
+
+        if devices is None:
+            devices = self._resources
+
+        request = ExecuteCommandRequest(self._get_uid(), self._session_id, command, devices)
+        response = self._query(request)
+
+        return GenericResponse(response)
+
+    def start_command(self, command: str, devices: str = None) -> "CommandHandle":
+        """
+        Starts command on every device at once without blocking.
+
+        One executeCommand is sent per device, so that the devices run the command concurrently.
+        Returns a handle to collect the responses.
+        """
+
+        if devices is None:
+            devices = self._resources
+
+        futures = {}
+        for device in split_resources(devices):
+            request = ExecuteCommandRequest(self._get_uid(), self._session_id, command, device)
+            futures[device] = self._submit(request, GenericResponse)
+
+        return CommandHandle(futures)
 
     def rename_device(self, device: str, new_name: str) -> GenericResponse:
         """
@@ -188,6 +696,8 @@ class Device(SLSC_Session):
 
         request = RenameDeviceRequest(self._get_uid(), self._session_id, device, new_name)
         response = self._query(request)
+        self._invalidate_cached()
+        self._invalidate_values()
 
         return GenericResponse(response)
 
@@ -207,7 +717,12 @@ class Device(SLSC_Session):
             devices = self._resources
 
         request = ReserveDeviceRequest(
-            self._get_uid, self._session_id, devices, access, reservation_group, reservation_timeout
+            self._get_uid(),
+            self._session_id,
+            devices,
+            access,
+            reservation_group,
+            reservation_timeout,
         )
         response = self._query(request)
 
@@ -229,6 +744,8 @@ class Device(SLSC_Session):
 
         request = ResetDevicesRequest(self._get_uid(), self._session_id, devices)
         response = self._query(request)
+        self._invalidate_cached()
+        self._invalidate_values()
 
         return GenericResponse(response)
 
@@ -265,10 +782,619 @@ class Device(SLSC_Session):
 
         request = CommitPropertiesRequest(self._get_uid(), self._session_id, devices)
         response = self._query(request)
+        self._invalidate_values(devices)
 
         return GenericResponse(response)
 
 
+class CommandHandle:
+    """
+    Commands started without blocking, one per device
+    """
+
+    def __init__(self, futures: Dict[str, Future]):
+        self._futures = futures
+
+    def done(self) -> bool:
+        return all(future.done() for future in self._futures.values())
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Waits until all commands completed, returning False on timeout
+        """
+        return not wait(self._futures.values(), timeout).not_done
+
+    def result(self, timeout: float = None) -> Dict[str, GenericResponse]:
+        """
+        Returns responses keyed by device, waiting for the commands to complete
+        """
+
+        if not self.wait(timeout):
+            raise TimeoutError("Commands did not complete in time")
+
+        return {device: future.result() for device, future in self._futures.items()}
+
+    def errors(self, timeout: float = None) -> Dict[str, dict]:
+        """
+        Returns errors keyed by device, waiting for the commands to complete
+        """
+
+        return {
+            device: response.error
+            for device, response in self.result(timeout).items()
+            if response.has_error()
+        }
+
+
+class PendingResponse:
+    """
+    Placeholder for the response of a request queued in a Batch
+    """
+
+    def __init__(self, response_type: type):
+        self._response_type = response_type
+        self._response = None
+
+    @property
+    def response(self) -> GenericResponse:
+        """
+        Response of the request, available once the batch has been sent
+        """
+        if self._response is None:
+            raise RuntimeError("Batch has not been sent")
+        return self._response
+
+    def _resolve(self, data: dict):
+        self._response = self._response_type(data)
+
+
+class Batch:
+    """
+    Queues requests of a session and sends them as JSON RPC batches.
+
+    Queued requests are sent by send() or when leaving a with block.
+    """
+
+    def __init__(self, session: SLSC_Session, max_size: int = None):
+        self._session = session
+        self._max_size = max_size
+        self._requests = []
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.send()
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def add(self, request: Request, response_type: type = GenericResponse) -> PendingResponse:
+        """
+        Queues request, returning a placeholder for its response
+        """
+
+        pending = PendingResponse(response_type)
+        self._requests.append(request)
+        self._pending.append(pending)
+
+        return pending
+
+    def send(self) -> List[GenericResponse]:
+        """
+        Sends all queued requests, returning their responses in the order they were queued
+        """
+
+        requests, self._requests = self._requests, []
+        pending, self._pending = self._pending, []
+
+        size = self._max_size or len(requests) or 1
+        for start in range(0, len(requests), size):
+            results = self._session._query_batch(requests[start : start + size])
+            for placeholder, data in zip(pending[start : start + size], results):
+                placeholder._resolve(data)
+
+        return [placeholder.response for placeholder in pending]
+
+    def get_property_list(self, resource: str = None) -> PendingResponse:
+        """
+        Queues getDevicePropertyList for given device.
+        No input resource will use the first resource in session.
+        """
+
+        session = self._session
+        if resource is None:
+            resource = split_resources(session._resources)[0]
+
+        request = GetDevicePropertyListRequest(session._get_uid(), session._session_id, resource)
+
+        return self.add(request, GetPropertyListResponse)
+
+    def get_property(self, property: str, resources: str = None) -> PendingResponse:
+        """
+        Queues getProperty.
+        Leaving resources empty will use the resources opened with the session
+        """
+
+        session = self._session
+        if resources is None:
+            resources = session._resources
+
+        request = GetPropertyRequest(
+            session._get_uid(), session._session_id, property, devices=resources
+        )
+
+        return self.add(request, getattr(session, "_property_response", GetPropertyResponse))
+
+    def get_property_information(self, property: str, resources: str = None) -> PendingResponse:
+        """
+        Queues getPropertyInformation.
+        Leaving resources empty will use the resources opened with the session
+        """
+
+        session = self._session
+        if resources is None:
+            resources = session._resources
+
+        request = GetPropertyInformationRequest(
+            session._get_uid(), session._session_id, property, devices=resources
+        )
+
+        return self.add(request, GetPropertyInformationResponse)
+
+
+class ChannelValues:
+    """
+    Columnar getProperty result of physical channels: values[i] belongs to channels[i]
+    """
+
+    __slots__ = ("channels", "values", "data_type", "error", "_index")
+
+    def __init__(self, channels: Tuple[str, ...], values, data_type: str = "", error: dict = None):
+        self.channels = channels
+        self.values = values
+        self.data_type = data_type
+        self.error = error
+        self._index = None
+
+    def __repr__(self) -> str:
+        return (
+            f"ChannelValues(channels={self.channels!r}, values={self.values!r}, "
+            f"data_type={self.data_type!r}, error={self.error!r})"
+        )
+
+    def has_error(self) -> bool:
+        return self.error is not None
+
+    def get(self, channel: str):
+        """
+        Returns the value of channel. The channel index is built on the first call.
+        """
+
+        if self._index is None:
+            self._index = {name: index for index, name in enumerate(self.channels)}
+        return self.values[self._index[channel]]
+
+    def as_dict(self) -> dict:
+        return dict(zip(self.channels, self.values))
+
+
+class PhysicalChannels(SLSC_Session):
+    """
+    Reference to SLSC physical channels.
+    Used to read and write properties of many channels at once
+
+    Channels may be given as ranges, such as "Mod1/ch0:63,Mod2/ch0:7", which are expanded once
+    and sent as a single request per property.
+    """
+
+    def __init__(
+        self,
+        chassis: str,
+        physical_channels: str,
+        metadata_cache: MetadataCache = None,
+        numpy_values: bool = False,
+    ):
+        """
+        numpy_values returns get_property values as NumPy arrays typed by their data type
+        (requires numpy).
+        """
+        if numpy_values:
+            arrays.require_numpy()
+
+        self._numpy_values = numpy_values
+        super().__init__(chassis, ",".join(expand_channels(physical_channels)), metadata_cache)
+
+    def initialize(self, resources: str) -> InitializeResponse:
+        """
+        Initialize SLSC connection, returning session ID
+        """
+
+        request = InitializeRequest(self._get_uid(), physical_channels=resources)
+        response = self._query(request)
+
+        return InitializeResponse(response)
+
+    @property
+    def channels(self) -> Tuple[str, ...]:
+        return split_resources(self._resources)
+
+    def _expand(self, channels: str) -> str:
+        if channels is None:
+            return self._resources
+        return ",".join(expand_channels(channels))
+
+    def _columns(self, response: GetPropertyResponse, channels: str) -> ChannelValues:
+        """
+        Arranges a getProperty response as one value per channel
+        """
+
+        channels = split_resources(channels)
+        if response.has_error():
+            return ChannelValues(channels, [], response.data_type, response.error)
+
+        values = response.value
+        if len(channels) == 1:
+            values = [values]
+        if self._numpy_values:
+            values = arrays.to_numpy(response.data_type, values)
+
+        return ChannelValues(channels, values, response.data_type)
+
+    def get_property(self, property: str, channels: str = None) -> ChannelValues:
+        """
+        Reads property of all channels with one request.
+        Leaving channels empty will use the channels opened with the session
+        """
+
+        channels = self._expand(channels)
+        template = self._get_template(
+            ("getProperty", property, channels),
+            lambda: GetPropertyRequest(0, self._session_id, property, physical_channels=channels),
+        )
+        response = GetPropertyResponse(self._query(template.bind(self._get_uid())))
+
+        return self._columns(response, channels)
+
+    def get_properties(
+        self, properties: List[str], channels: str = None
+    ) -> Dict[str, ChannelValues]:
+        """
+        Reads several properties of all channels in a single batch
+        """
+
+        channels = self._expand(channels)
+        batch = self.batch()
+        pending = {
+            property: batch.add(
+                GetPropertyRequest(
+                    self._get_uid(), self._session_id, property, physical_channels=channels
+                ),
+                GetPropertyResponse,
+            )
+            for property in properties
+        }
+        batch.send()
+
+        return {
+            property: self._columns(placeholder.response, channels)
+            for property, placeholder in pending.items()
+        }
+
+    def get_property_information(
+        self, property: str, channels: str = None
+    ) -> GetPropertyInformationResponse:
+        """
+        Gets all information of a property
+
+        Leaving channels empty will use the channels opened with this session
+        """
+
+        channels = self._expand(channels)
+
+        return self._query_cached(
+            ("getPropertyInformation", property, split_resources(channels)),
+            lambda: GetPropertyInformationRequest(
+                self._get_uid(), self._session_id, property, physical_channels=channels
+            ),
+            GetPropertyInformationResponse,
+        )
+
+    def set_property(self, property: str, value, channels: str = None) -> GenericResponse:
+        """
+        Sets property of all channels to the same value with one request.
+        Dynamic properties take effect once committed with commit_properties.
+        """
+
+        channels = self._expand(channels)
+        request = SetPropertyRequest(
+            self._get_uid(), self._session_id, property, value, physical_channels=channels
+        )
+
+        return GenericResponse(self._query(request))
+
+    def set_values(self, property: str, values, channels: str = None) -> List[GenericResponse]:
+        """
+        Sets property to one value per channel, values[i] going to the i-th channel.
+
+        Channels sharing a value are written with one request, and all requests are sent in a
+        single batch. NumPy arrays are accepted as values.
+        """
+
+        channels = split_resources(self._expand(channels))
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+        if len(values) != len(channels):
+            raise ValueError(f"Got {len(values)} values for {len(channels)} channels")
+
+        groups = {}
+        for channel, value in zip(channels, values):
+            key = _freeze(value)
+            if key not in groups:
+                groups[key] = (value, [])
+            groups[key][1].append(channel)
+
+        batch = self.batch()
+        for value, grouped in groups.values():
+            request = SetPropertyRequest(
+                self._get_uid(),
+                self._session_id,
+                property,
+                value,
+                physical_channels=",".join(grouped),
+            )
+            batch.add(request)
+
+        return batch.send()
+
+    def commit_properties(self, channels: str = None) -> GenericResponse:
+        """
+        Commits properties with pending changes of channels to SLSC hardware.
+        """
+
+        request = CommitPropertiesRequest(
+            self._get_uid(), self._session_id, physical_channels=self._expand(channels)
+        )
+        response = self._query(request)
+
+        return GenericResponse(response)
+
+
+class NvmemAreas(SLSC_Session):
+    """
+    Reference to SLSC nvmem areas.
+    Used to read and write the non-volatile memory of modules
+    """
+
+    def __init__(self, chassis: str, nvmem_areas: str):
+        super().__init__(chassis, nvmem_areas)
+
+    def initialize(self, resources: str) -> InitializeResponse:
+        """
+        Initialize SLSC connection, returning session ID
+        """
+
+        request = InitializeRequest(self._get_uid(), nvmem_areas=resources)
+        response = self._query(request)
+
+        return InitializeResponse(response)
+
+    def _area(self, area: str) -> str:
+        return split_resources(self._resources)[0] if area is None else area
+
+    def get_nvmem_bytes(self, offset: int, count: int, area: str = None) -> GetNvmemBytesResponse:
+        """
+        Reads count bytes starting at offset.
+        No input area will use the first area in session.
+        """
+
+        request = GetNvmemBytesRequest(
+            self._get_uid(), self._session_id, self._area(area), offset, count
+        )
+        response = self._query(request)
+
+        return GetNvmemBytesResponse(response)
+
+    def set_nvmem_bytes(self, offset: int, data: bytes, area: str = None) -> GenericResponse:
+        """
+        Writes data starting at offset. Changes take effect once committed.
+        No input area will use the first area in session.
+        """
+
+        request = SetNvmemBytesRequest(
+            self._get_uid(), self._session_id, self._area(area), offset, data
+        )
+        response = self._query(request)
+
+        return GenericResponse(response)
+
+    def commit_nvmem_areas(self, areas: str = None) -> GenericResponse:
+        """
+        Commits pending changes of nvmem areas.
+
+        By default, function will commit session areas
+        """
+
+        if areas is None:
+            areas = self._resources
+
+        request = CommitNvmemAreasRequest(self._get_uid(), self._session_id, areas)
+        response = self._query(request)
+
+        return GenericResponse(response)
+
+    def read_into(
+        self, buffer, offset: int = 0, area: str = None, chunk_size: int = 256
+    ) -> List[GenericResponse]:
+        """
+        Fills writable buffer (bytearray or memoryview) with bytes starting at offset.
+
+        The area is read in chunks of chunk_size bytes, all sent in a single batch, and each
+        chunk is copied straight into its slice of buffer. Returns responses with errors.
+        """
+
+        view = memoryview(buffer).cast("B")
+        area = self._area(area)
+
+        batch = self.batch()
+        chunks = []
+        for start in range(0, len(view), chunk_size):
+            count = min(chunk_size, len(view) - start)
+            request = GetNvmemBytesRequest(
+                self._get_uid(), self._session_id, area, offset + start, count
+            )
+            chunks.append((start, count, batch.add(request, GetNvmemBytesResponse)))
+        batch.send()
+
+        errors = []
+        for start, count, pending in chunks:
+            response = pending.response
+            if response.has_error():
+                errors.append(response)
+            else:
+                view[start : start + count] = bytes(response.data)
+
+        return errors
+
+    def write_ranges(
+        self, ranges: Iterable[Tuple[int, bytes]], area: str = None, chunk_size: int = 256
+    ) -> List[GenericResponse]:
+        """
+        Writes (offset, data) ranges in a single batch, splitting data into chunk_size writes.
+        Changes take effect once committed.
+        """
+
+        area = self._area(area)
+
+        batch = self.batch()
+        for offset, data in ranges:
+            data = memoryview(data).cast("B")
+            for start in range(0, len(data), chunk_size):
+                request = SetNvmemBytesRequest(
+                    self._get_uid(),
+                    self._session_id,
+                    area,
+                    offset + start,
+                    data[start : start + chunk_size],
+                )
+                batch.add(request)
+
+        return batch.send()
+
+
+def _freeze(value):
+    """
+    Returns hashable form of a property value.
+
+    Scalars are paired with their type, so that equal values of different types, such as 1, 1.0
+    and True, are not sent as one value.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return (type(value), value)
+
+
+class WriteBuffer:
+    """
+    Stages property writes of a Device and sends them as one batch with a single commit.
+
+    Setting a property of a resource again replaces the staged value. Staged writes with the same
+    property and value are sent as one setProperty covering all of their resources.
+    Staged writes are sent by flush() or when leaving a with block without an exception.
+
+    With validate, all writes are checked against their property information before any is sent,
+    raising PropertyValidationError for invalid writes. coerce converts values to the data type
+    of the property and clamps them to its range instead of rejecting them.
+    """
+
+    def __init__(
+        self,
+        device: Device,
+        commit: bool = True,
+        max_size: int = None,
+        validate: bool = False,
+        coerce: bool = False,
+    ):
+        self._device = device
+        self._commit = commit
+        self._max_size = max_size
+        self._validate = validate or coerce
+        self._coerce = coerce
+        self._writes = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self) -> int:
+        return len(self._writes)
+
+    def set(self, property: str, value, resources: str = None):
+        """
+        Stages property write.
+        Leaving resources empty will use the resources opened with the session
+        """
+
+        if resources is None:
+            resources = self._device._resources
+
+        for resource in split_resources(resources):
+            self._writes[(property, resource)] = value
+
+    def groups(self) -> List[tuple]:
+        """
+        Returns staged writes grouped as (property, value, resources) in staging order
+        """
+
+        groups = {}
+        for (property, resource), value in self._writes.items():
+            key = (property, _freeze(value))
+            if key not in groups:
+                groups[key] = (property, value, [])
+            groups[key][2].append(resource)
+
+        return [
+            (property, value, ",".join(resources)) for property, value, resources in groups.values()
+        ]
+
+    def flush(self) -> List[GenericResponse]:
+        """
+        Sends staged writes, then commits all written resources if every write succeeded.
+
+        Returns the setProperty responses followed by the commit response, if committed.
+        """
+
+        device = self._device
+        groups = self.groups()
+        if self._validate:
+            groups = validate_writes(device, groups, self._coerce)
+
+        written = ",".join(dict.fromkeys(resource for _, resource in self._writes))
+        self._writes = {}
+        if not groups:
+            return []
+
+        batch = device.batch(self._max_size)
+        for property, value, resources in groups:
+            request = SetPropertyRequest(
+                device._get_uid(), device._session_id, property, value, devices=resources
+            )
+            batch.add(request)
+
+        responses = batch.send()
+        device._invalidate_values(written)
+
+        if self._commit and not any(response.has_error() for response in responses):
+            responses.append(device.commit_properties(written))
+
+        return responses
+
+
 if __name__ == "__main__":
     chassis_name = "SLSC-12001-TSE"
 
@@ -0,0 +1,183 @@
+import threading
+import time
+from contextlib import contextmanager
+from slsc_web.session import Device
+
+
+class SessionPool:
+    """
+    Pool of initialized Device sessions keyed by chassis, devices and setup
+
+    Leasing a session reuses an idle session of the same key instead of initializing a new one.
+    Sessions are optionally connected and reserved once when created. Idle sessions are checked
+    with getSessionPropertyList before being handed out, and closed after idle_timeout seconds.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = 4,
+        idle_timeout: float = 300.0,
+        health_check: bool = True,
+        **session_options,
+    ):
+        """
+        max_idle is the number of idle sessions kept per key.
+        session_options are passed to every Device created by the pool.
+        """
+
+        self._max_idle = max_idle
+        self._idle_timeout = idle_timeout
+        self._health_check = health_check
+        self._session_options = session_options
+        self._idle = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @contextmanager
+    def lease(self, chassis: str, devices: str, connect: bool = False, reserve: bool = False):
+        """
+        Leases a session for the duration of a with block.
+
+        Sessions leaving the block with an exception are closed instead of returned to the pool.
+        """
+
+        device = self.acquire(chassis, devices, connect, reserve)
+        try:
+            yield device
+        except BaseException:
+            self.release(device, healthy=False)
+            raise
+        else:
+            self.release(device)
+
+    def acquire(
+        self, chassis: str, devices: str, connect: bool = False, reserve: bool = False
+    ) -> Device:
+        """
+        Returns an idle session of the key or a new one. Return it with release.
+        """
+
+        key = (chassis, devices, connect, reserve)
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Session pool is closed")
+
+                expired = self._evict_idle()
+                idle = self._idle.get(key)
+                device = idle.pop()[0] if idle else None
+
+            for stale in expired:
+                self._close(stale)
+
+            if device is None:
+                device = self._create(chassis, devices, connect, reserve)
+                break
+            if self._is_healthy(device):
+                break
+
+            self._close(device)
+
+        with self._lock:
+            self._keys[id(device)] = key
+
+        return device
+
+    def release(self, device: Device, healthy: bool = True):
+        """
+        Returns a leased session to the pool, closing it if unhealthy or not needed
+        """
+
+        with self._lock:
+            key = self._keys.pop(id(device), None)
+            idle = self._idle.setdefault(key, []) if key is not None else None
+            keep = healthy and idle is not None and not self._closed and len(idle) < self._max_idle
+            if keep:
+                idle.append((device, time.monotonic()))
+
+        if not keep:
+            self._close(device)
+
+    def evict_idle(self) -> int:
+        """
+        Closes sessions idle longer than idle_timeout, returning how many were closed
+        """
+
+        with self._lock:
+            expired = self._evict_idle()
+
+        for device in expired:
+            self._close(device)
+
+        return len(expired)
+
+    def close(self):
+        """
+        Closes all idle sessions. Leased sessions are closed when released.
+        """
+
+        with self._lock:
+            self._closed = True
+            idle = [device for sessions in self._idle.values() for device, _ in sessions]
+            self._idle = {}
+
+        for device in idle:
+            self._close(device)
+
+    def _evict_idle(self) -> list:
+        """
+        Removes expired sessions from the pool and returns them. Call with lock held.
+        """
+
+        deadline = time.monotonic() - self._idle_timeout
+        expired = []
+        for key, sessions in self._idle.items():
+            expired.extend(device for device, released in sessions if released < deadline)
+            self._idle[key] = [entry for entry in sessions if entry[1] >= deadline]
+
+        return expired
+
+    def _create(self, chassis: str, devices: str, connect: bool, reserve: bool) -> Device:
+        device = Device(chassis, devices, **self._session_options)
+        if not device._session_id:
+            device._rpc.close()
+            raise ConnectionError(f"Failed to initialize session on {chassis}")
+
+        steps = []
+        if connect:
+            steps.append(device.connect)
+        if reserve:
+            steps.append(device.reserve_devices)
+
+        for step in steps:
+            response = step()
+            if response.has_error():
+                self._close(device)
+                raise ConnectionError(f"{step.__name__} failed on {chassis}: {response.error}")
+
+        return device
+
+    def _is_healthy(self, device: Device) -> bool:
+        if not self._health_check:
+            return True
+
+        try:
+            return not device.get_session_properties().has_error()
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(device: Device):
+        try:
+            device.close()
+        except Exception:
+            pass
+        finally:
+            device._rpc.close()
@@ -0,0 +1,575 @@
+import copy
+import itertools
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, NamedTuple
+
+
+class Property(NamedTuple):
+    """
+    Simulated property of a device, physical channel or nvmem area
+
+    Writes to dynamic properties take effect once committed, writes to static properties at once.
+    minimum and maximum bound numeric writes when given.
+    """
+
+    value: object
+    data_type: str = "Int32"
+    dynamic: bool = False
+    access: str = "Read/Write"
+    unit: str = ""
+    minimum: object = None
+    maximum: object = None
+    description: str = ""
+
+
+class SimulatedDevice:
+    """
+    Simulated device with its properties, physical channels, nvmem areas, registers and commands
+
+    channels maps channel names to their properties, nvmem_areas maps area names to their size
+    in bytes and commands maps command names to their description.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        properties: Dict[str, Property] = None,
+        channels: Dict[str, Dict[str, Property]] = None,
+        nvmem_areas: Dict[str, int] = None,
+        registers: Dict[int, int] = None,
+        commands: Dict[str, str] = None,
+    ):
+        self.name = name
+        self.properties = dict(properties or {})
+        self.channels = {channel: dict(values) for channel, values in (channels or {}).items()}
+        self.nvmem_areas = dict(nvmem_areas or {})
+        self.registers = dict(registers or {})
+        self.commands = dict(commands or {})
+
+
+def default_devices(
+    chassis: str = "SLSC-Sim", modules: int = 2, channels: int = 8
+) -> List[SimulatedDevice]:
+    """
+    Creates a chassis holding modules Mod1..ModN with channels ch0..chN-1 each
+    """
+
+    identity = {
+        "Dev.ProductName": Property("SLSC-Sim", "String", access="Read-Only"),
+        "Dev.FirmwareRevision": Property("1.0.0", "String", access="Read-Only"),
+        "Dev.SerialNum": Property("0001", "String", access="Read-Only"),
+    }
+    names = [f"Mod{slot}" for slot in range(1, modules + 1)]
+
+    devices = [
+        SimulatedDevice(
+            chassis,
+            dict(identity, **{"Dev.Modules": Property(names, "StringArray", access="Read-Only")}),
+        )
+    ]
+    for slot, name in enumerate(names, 1):
+        channel_names = [f"{name}/ch{index}" for index in range(channels)]
+        devices.append(
+            SimulatedDevice(
+                name,
+                dict(
+                    identity,
+                    **{
+                        "Dev.SlotNum": Property(slot, "Int32", access="Read-Only"),
+                        "Dev.PhysicalChannels": Property(
+                            channel_names, "StringArray", access="Read-Only"
+                        ),
+                        "Dev.Temperature": Property(25.0, "Double", True, "Read-Only", "C"),
+                        "Dev.Label": Property("", "String"),
+                    },
+                ),
+                channels={
+                    channel: {
+                        "AO.Voltage": Property(
+                            0.0, "Double", True, unit="V", minimum=-10.0, maximum=10.0
+                        ),
+                        "AO.Enable": Property(False, "Bool", True),
+                    }
+                    for channel in channel_names
+                },
+                nvmem_areas={f"{name}/nvmem0": 1024},
+                commands={"SelfCalibrate": "Calibrates the module"},
+            )
+        )
+
+    return devices
+
+
+class _Fault(Exception):
+    def __init__(self, code: int, message: str):
+        self.error = {"code": code, "message": message}
+        super().__init__(message)
+
+
+_RESOURCE_KINDS = ("devices", "physical_channels", "nvmem_areas")
+
+
+class Simulator:
+    """
+    In-process SLSC Web API serving the JSON RPC methods of slsc_web.requests.
+
+    call() answers a request or batch directly, and start() serves /nislsc/call over HTTP on
+    localhost, returning an address usable as chassis name by sessions.
+
+    Every HTTP request is delayed by latency plus a random jitter, and every call by its
+    method_latency. inject_error makes calls fail with a given error. Random choices use seed,
+    so runs are reproducible.
+    """
+
+    def __init__(
+        self,
+        devices: Iterable[SimulatedDevice] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        method_latency: Dict[str, float] = None,
+        seed: int = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.method_latency = dict(method_latency or {})
+        self.calls = {}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._session_ids = itertools.count(1)
+        self._sessions = {}
+        self._reservations = {}
+        self._faults = []
+        self._server = None
+        self._load(default_devices() if devices is None else devices)
+        self._methods = {
+            "initializeSession": self._initialize_session,
+            "closeSession": self._close_session,
+            "abortSession": self._abort_session,
+            "getSessionPropertyList": self._get_session_property_list,
+            "getDevicePropertyList": self._get_device_property_list,
+            "getProperty": self._get_property,
+            "setProperty": self._set_property,
+            "getPropertyInformation": self._get_property_information,
+            "commitProperties": self._commit_properties,
+            "connectToDevices": self._devices_call,
+            "disconnectFromDevices": self._devices_call,
+            "resetDevices": self._reset_devices,
+            "renameDevice": self._rename_device,
+            "reserveDevices": self._reserve_devices,
+            "unreserveDevices": self._unreserve_devices,
+            "readRegister": self._read_register,
+            "writeRegister": self._write_register,
+            "getNvmemBytes": self._get_nvmem_bytes,
+            "setNvmemBytes": self._set_nvmem_bytes,
+            "commitNvmemAreas": self._commit_nvmem_areas,
+            "getCommandList": self._get_command_list,
+            "getCommandInformation": self._get_command_information,
+            "executeCommand": self._execute_command,
+        }
+
+    def _load(self, devices: Iterable[SimulatedDevice]):
+        self._devices = {}
+        self._properties = {}
+        self._nvmem = {}
+        for device in devices:
+            self._devices[device.name] = device
+            self._properties[device.name] = device.properties
+            self._properties.update(device.channels)
+            for area, size in device.nvmem_areas.items():
+                self._properties[area] = {
+                    "Nvmem.Size": Property(size, "Uint32", access="Read-Only")
+                }
+                self._nvmem[area] = bytearray(size)
+
+        self._initial = {
+            resource: {name: property.value for name, property in properties.items()}
+            for resource, properties in self._properties.items()
+        }
+        self._values = copy.deepcopy(self._initial)
+        self._pending = {}
+        self._nvmem_pending = {}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def address(self) -> str:
+        """
+        host:port the simulator is served on
+        """
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self, port: int = 0) -> str:
+        """
+        Serves the simulator over HTTP on localhost, returning its address.
+        Port 0 picks a free port.
+        """
+
+        handler = type("Handler", (_Handler,), {"simulator": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+        return self.address
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def inject_error(
+        self,
+        method: str = None,
+        code: int = -32000,
+        message: str = "Injected error",
+        count: int = None,
+        probability: float = 1.0,
+    ):
+        """
+        Makes calls of method (of any method if None) fail with the given error.
+
+        The error is returned count times (indefinitely if None), each call failing with the
+        given probability.
+        """
+        with self._lock:
+            self._faults.append([method, {"code": code, "message": message}, count, probability])
+
+    def clear_errors(self):
+        with self._lock:
+            self._faults = []
+
+    def value(self, resource: str, property: str):
+        """
+        Current value of property of resource
+        """
+        return self._values[resource][property]
+
+    def call(self, request):
+        """
+        Answers a JSON RPC request object or batch of request objects
+        """
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if isinstance(request, list):
+            delay += sum(self.method_latency.get(entry.get("method"), 0.0) for entry in request)
+        else:
+            delay += self.method_latency.get(request.get("method"), 0.0)
+        if delay:
+            time.sleep(delay)
+
+        if isinstance(request, list):
+            if not request:
+                return _response(None, error={"code": -32600, "message": "Invalid Request"})
+            return [self._call(entry) for entry in request]
+
+        return self._call(request)
+
+    def _call(self, request: dict) -> dict:
+        id = request.get("id") if isinstance(request, dict) else None
+        method = self._methods.get(request.get("method")) if isinstance(request, dict) else None
+        if method is None:
+            return _response(id, error={"code": -32601, "message": "Method not found"})
+
+        with self._lock:
+            name = request["method"]
+            self.calls[name] = self.calls.get(name, 0) + 1
+            try:
+                self._check_faults(name)
+                return _response(id, method(request.get("params", {})))
+            except _Fault as fault:
+                return _response(id, error=fault.error)
+            except (KeyError, TypeError, ValueError) as error:
+                return _response(id, error={"code": -32602, "message": f"Invalid params: {error}"})
+
+    def _check_faults(self, method: str):
+        for fault in self._faults:
+            target, error, count, probability = fault
+            if target not in (None, method) or count == 0:
+                continue
+            if probability < 1.0 and self._random.random() >= probability:
+                continue
+            if count is not None:
+                fault[2] = count - 1
+            raise _Fault(error["code"], error["message"])
+
+    def _session(self, params: dict) -> tuple:
+        session = self._sessions.get(params.get("session_id"))
+        if session is None:
+            raise _Fault(-32000, f"Invalid session {params.get('session_id')}")
+        return session
+
+    def _resources(self, params: dict) -> list:
+        for kind in _RESOURCE_KINDS:
+            if kind in params:
+                resources = params[kind]
+                break
+        else:
+            raise _Fault(-32602, "No resources given")
+
+        for resource in resources:
+            self._resource(resource)
+        return resources
+
+    def _resource(self, resource: str) -> dict:
+        properties = self._properties.get(resource)
+        if properties is None:
+            raise _Fault(-32602, f"Unknown resource {resource}")
+        return properties
+
+    def _property(self, resource: str, name: str) -> Property:
+        property = self._resource(resource).get(name)
+        if property is None:
+            raise _Fault(-32602, f"Unknown property {name} of {resource}")
+        return property
+
+    def _device(self, name: str) -> SimulatedDevice:
+        device = self._devices.get(name)
+        if device is None:
+            raise _Fault(-32602, f"Unknown device {name}")
+        return device
+
+    def _initialize_session(self, params: dict) -> dict:
+        resources = self._resources(params)
+        session_id = f"_session{next(self._session_ids)}"
+        self._sessions[session_id] = tuple(resources)
+        return {"session_id": session_id}
+
+    def _close_session(self, params: dict) -> dict:
+        self._session(params)
+        session_id = params["session_id"]
+        del self._sessions[session_id]
+        self._reservations = {
+            device: owner for device, owner in self._reservations.items() if owner != session_id
+        }
+        return {}
+
+    def _abort_session(self, params: dict) -> dict:
+        self._session(params)
+        return {}
+
+    def _get_session_property_list(self, params: dict) -> dict:
+        self._session(params)
+        return {"properties": ["Session.Resources"]}
+
+    def _get_device_property_list(self, params: dict) -> dict:
+        self._session(params)
+        properties = self._resource(params["device"])
+        return {
+            "static_properties": [name for name, p in properties.items() if not p.dynamic],
+            "dynamic_properties": [name for name, p in properties.items() if p.dynamic],
+        }
+
+    def _get_property(self, params: dict) -> dict:
+        self._session(params)
+        name = params["property"]
+        resources = self._resources(params)
+        data_type = self._property(resources[0], name).data_type
+        values = []
+        for resource in resources:
+            self._property(resource, name)
+            values.append(self._values[resource][name])
+
+        return {"data_type": data_type, "value": values[0] if len(values) == 1 else values}
+
+    def _set_property(self, params: dict) -> dict:
+        self._session(params)
+        name, value = params["property"], params["value"]
+        resources = self._resources(params)
+        for resource in resources:
+            property = self._property(resource, name)
+            if property.access in ("Read-Only", "ReadOnly", 1):
+                raise _Fault(-32001, f"{name} of {resource} is read-only")
+            if property.minimum is not None and value < property.minimum:
+                raise _Fault(-32002, f"{value} is below the minimum of {name}")
+            if property.maximum is not None and value > property.maximum:
+                raise _Fault(-32002, f"{value} is above the maximum of {name}")
+
+        for resource in resources:
+            if self._property(resource, name).dynamic:
+                self._pending.setdefault(resource, {})[name] = value
+            else:
+                self._values[resource][name] = value
+
+        return {}
+
+    def _get_property_information(self, params: dict) -> dict:
+        self._session(params)
+        resources = self._resources(params)
+        property = self._property(resources[0], params["property"])
+        return {
+            "description": property.description,
+            "documentation": "",
+            "data_type": property.data_type,
+            "access": property.access,
+            "unit": property.unit,
+            "min_value": property.minimum,
+            "max_value": property.maximum,
+        }
+
+    def _commit_properties(self, params: dict) -> dict:
+        self._session(params)
+        for resource in self._resources(params):
+            self._values[resource].update(self._pending.pop(resource, {}))
+            if resource in self._devices:
+                for channel in self._devices[resource].channels:
+                    self._values[channel].update(self._pending.pop(channel, {}))
+        return {}
+
+    def _devices_call(self, params: dict) -> dict:
+        self._session(params)
+        self._resources(params)
+        return {}
+
+    def _reset_devices(self, params: dict) -> dict:
+        self._session(params)
+        for device in self._resources(params):
+            for resource in [device, *self._device(device).channels]:
+                self._values[resource] = copy.deepcopy(self._initial[resource])
+                self._pending.pop(resource, None)
+        return {}
+
+    def _rename_device(self, params: dict) -> dict:
+        self._session(params)
+        old, new = params["device"], params["new_device_name"]
+        device = self._device(old)
+        if new in self._properties:
+            raise _Fault(-32602, f"Resource {new} already exists")
+
+        device.name = new
+        self._devices[new] = self._devices.pop(old)
+        for table in (self._properties, self._values, self._initial):
+            table[new] = table.pop(old)
+        return {}
+
+    def _reserve_devices(self, params: dict) -> dict:
+        self._session(params)
+        devices = self._resources(params)
+        for device in devices:
+            owner = self._reservations.get(device)
+            if owner is not None and owner != params["session_id"]:
+                raise _Fault(-32003, f"{device} is reserved by another session")
+        for device in devices:
+            self._reservations[device] = params["session_id"]
+        return {}
+
+    def _unreserve_devices(self, params: dict) -> dict:
+        self._session(params)
+        for device in self._resources(params):
+            if self._reservations.get(device) == params["session_id"]:
+                del self._reservations[device]
+        return {}
+
+    def _read_register(self, params: dict) -> dict:
+        self._session(params)
+        return {"value": self._device(params["device"]).registers.get(params["address"], 0)}
+
+    def _write_register(self, params: dict) -> dict:
+        self._session(params)
+        self._device(params["device"]).registers[params["address"]] = params["value"]
+        return {}
+
+    def _area(self, params: dict, count: int) -> str:
+        """
+        Returns the nvmem area of params after checking that count bytes at offset fit in it
+        """
+
+        self._session(params)
+        area, offset = params["nvmem_area"], params["offset"]
+        if area not in self._nvmem:
+            raise _Fault(-32602, f"Unknown nvmem area {area}")
+        if offset < 0 or offset + count > len(self._nvmem[area]):
+            raise _Fault(-32602, f"Access outside of nvmem area {area}")
+        return area
+
+    def _get_nvmem_bytes(self, params: dict) -> dict:
+        area = self._area(params, params["count"])
+        offset = params["offset"]
+        return {"bytes": list(self._nvmem[area][offset : offset + params["count"]])}
+
+    def _set_nvmem_bytes(self, params: dict) -> dict:
+        offset, values = params["offset"], params["bytes"]
+        area = self._area(params, len(values))
+        pending = self._nvmem_pending.setdefault(area, bytearray(self._nvmem[area]))
+        pending[offset : offset + len(values)] = bytes(values)
+        return {}
+
+    def _commit_nvmem_areas(self, params: dict) -> dict:
+        self._session(params)
+        for area in params["nvmem_areas"]:
+            if area in self._nvmem_pending:
+                self._nvmem[area] = self._nvmem_pending.pop(area)
+        return {}
+
+    def _get_command_list(self, params: dict) -> dict:
+        self._session(params)
+        return {"commands": list(self._device(params["device"]).commands)}
+
+    def _get_command_information(self, params: dict) -> dict:
+        self._session(params)
+        commands = self._device(params["device"]).commands
+        if params["command"] not in commands:
+            raise _Fault(-32602, f"Unknown command {params['command']}")
+        return {"description": commands[params["command"]], "documentation": ""}
+
+    def _execute_command(self, params: dict) -> dict:
+        self._session(params)
+        for device in params["devices"]:
+            if params["command"] not in self._device(device).commands:
+                raise _Fault(-32602, f"Unknown command {params['command']} of {device}")
+        return {}
+
+
+def _response(id, result: dict = None, error: dict = None) -> dict:
+    if error is not None:
+        return {"id": id, "jsonrpc": "2.0", "error": error}
+    return {"id": id, "jsonrpc": "2.0", "result": result}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    simulator = None
+
+    def do_POST(self):
+        if self.path != "/nislsc/call":
+            self.send_error(404)
+            return
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            request = json.loads(body)
+        except ValueError:
+            response = _response(None, error={"code": -32700, "message": "Parse error"})
+        else:
+            response = self.simulator.call(request)
+
+        data = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+if __name__ == "__main__":
+    with Simulator() as simulator:
+        print(f"Serving simulated chassis on {simulator.address}, press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
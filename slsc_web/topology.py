@@ -0,0 +1,141 @@
+from typing import Dict, Iterable, NamedTuple, Union
+from slsc_web.requests import ResourceSet, split_resources
+from slsc_web.session import Device
+
+
+class TopologyError(RuntimeError):
+    """
+    Raised when the chassis topology cannot be discovered
+
+    errors maps each resource to the error returned by the server.
+    """
+
+    def __init__(self, errors: Dict[str, dict]):
+        self.errors = errors
+        super().__init__(f"Topology discovery failed for {', '.join(errors)}")
+
+
+class Module(NamedTuple):
+    """
+    Module of a chassis with its slot and physical channels
+    """
+
+    name: str
+    slot: int
+    channels: ResourceSet
+
+
+class Topology:
+    """
+    Chassis -> module -> channel tree indexed for constant time lookups.
+
+    Modules are found by name or slot number, and channels by name. devices and channels are
+    ResourceSets that can be passed to sessions and requests as they are.
+    """
+
+    def __init__(self, chassis: str, modules: Iterable[Module]):
+        self.chassis = chassis
+        self.modules = tuple(modules)
+        self.devices = ResourceSet(module.name for module in self.modules)
+        self.channels = ResourceSet(
+            channel for module in self.modules for channel in module.channels
+        )
+        self._by_name = {module.name: module for module in self.modules}
+        self._by_slot = {module.slot: module for module in self.modules}
+        self._by_channel = {
+            channel: module for module in self.modules for channel in module.channels
+        }
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    def __iter__(self):
+        return iter(self.modules)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name or name in self._by_channel
+
+    def __getitem__(self, key: Union[str, int]) -> Module:
+        """
+        Module by name, slot number or name of one of its channels
+        """
+
+        if isinstance(key, int):
+            return self._by_slot[key]
+        module = self._by_name.get(key)
+        if module is None:
+            module = self._by_channel[key]
+        return module
+
+    def channels_of(self, modules: Union[str, ResourceSet]) -> ResourceSet:
+        """
+        Channels of comma separated modules, in module order
+        """
+
+        return ResourceSet(
+            channel
+            for module in split_resources(modules)
+            for channel in self._by_name[module].channels
+        )
+
+    @classmethod
+    def discover(
+        cls,
+        chassis: str,
+        modules_property: str = "Dev.Modules",
+        slot_property: str = "Dev.SlotNum",
+        channels_property: str = "Dev.PhysicalChannels",
+        chassis_device: str = None,
+    ) -> "Topology":
+        """
+        Enumerates modules of chassis and their slots and channels.
+
+        The module list is read from the chassis, then slots and channels of all modules are read
+        in a single batch. Channels may be reported as names or as a channel count, in which case
+        they are named <module>/ch<index>. Raises TopologyError if any read fails.
+        chassis_device names the chassis device if it differs from the chassis address.
+        """
+
+        with Device(chassis, chassis_device or chassis) as dev:
+            response = dev.get_property(modules_property)
+        if response.has_error():
+            raise TopologyError({chassis: response.error})
+
+        modules = ResourceSet(response.value)
+        if not modules:
+            return cls(chassis, ())
+
+        with Device(chassis, modules) as dev:
+            batch = dev.batch()
+            pending = [
+                (
+                    module,
+                    batch.get_property(slot_property, module),
+                    batch.get_property(channels_property, module),
+                )
+                for module in modules
+            ]
+            batch.send()
+
+        errors = {
+            module: placeholder.response.error
+            for module, *placeholders in pending
+            for placeholder in placeholders
+            if placeholder.response.has_error()
+        }
+        if errors:
+            raise TopologyError(errors)
+
+        return cls(
+            chassis,
+            (
+                Module(module, slot.response.value, _channel_names(module, channels.response.value))
+                for module, slot, channels in pending
+            ),
+        )
+
+
+def _channel_names(module: str, channels) -> ResourceSet:
+    if isinstance(channels, int):
+        return ResourceSet(f"{module}/ch{index}" for index in range(channels))
+    return ResourceSet(channels)
@@ -0,0 +1,173 @@
+import math
+from typing import List, Tuple
+from slsc_web.responses import GetPropertyInformationResponse, PropertyDataType
+
+
+class PropertyValidationError(ValueError):
+    """
+    Raised when property writes fail validation against their property information
+
+    errors lists (property, resources, value, reason) of every rejected write.
+    """
+
+    def __init__(self, errors: List[tuple]):
+        self.errors = errors
+        lines = [
+            f"{property} of {resources} = {value!r}: {reason}"
+            for property, resources, value, reason in errors
+        ]
+        super().__init__("Invalid property writes:\n" + "\n".join(lines))
+
+
+_INTEGER_RANGES = {
+    PropertyDataType.Int32: (-(2**31), 2**31 - 1),
+    PropertyDataType.Int64: (-(2**63), 2**63 - 1),
+    PropertyDataType.Uint32: (0, 2**32 - 1),
+    PropertyDataType.Uint64: (0, 2**64 - 1),
+}
+
+_ELEMENT_TYPES = {
+    PropertyDataType.BoolArray: PropertyDataType.Bool,
+    PropertyDataType.DoubleArray: PropertyDataType.Double,
+    PropertyDataType.Int32Array: PropertyDataType.Int32,
+    PropertyDataType.Int64Array: PropertyDataType.Int64,
+    PropertyDataType.StringArray: PropertyDataType.String,
+    PropertyDataType.Uint32Array: PropertyDataType.Uint32,
+    PropertyDataType.Uint64Array: PropertyDataType.Uint64,
+}
+
+
+def is_writable(access) -> bool:
+    """
+    True unless access says the property cannot be written.
+    Access may be the numeric mode or its name, e.g. 1, "ReadOnly" or "Read-Only".
+    """
+
+    if isinstance(access, int):
+        return access in (2, 3)
+    if not access:
+        return True
+
+    name = "".join(character for character in str(access).lower() if character.isalpha())
+    return name not in ("none", "readonly", "read")
+
+
+def validate_value(information: GetPropertyInformationResponse, value, coerce: bool = False):
+    """
+    Checks value against the data type, access and range of a property.
+
+    Returns the value, converted to the data type and clamped to the range if coerce is set.
+    Raises ValueError describing the first problem found.
+    """
+
+    if not is_writable(information.access):
+        raise ValueError(f"property is {information.access}")
+
+    data_type = information.data_type
+    minimum, maximum = information.minimum_value, information.maximum_value
+
+    element_type = _ELEMENT_TYPES.get(data_type)
+    if element_type is None:
+        return _validate_scalar(data_type, value, minimum, maximum, coerce)
+
+    if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+        raise ValueError(f"expected {data_type.name}")
+
+    return [_validate_scalar(element_type, item, minimum, maximum, coerce) for item in value]
+
+
+def _validate_scalar(data_type: PropertyDataType, value, minimum, maximum, coerce: bool):
+    if data_type == PropertyDataType.Bool:
+        if coerce and not isinstance(value, bool):
+            if value in (0, 1):
+                value = bool(value)
+            elif str(value).lower() in ("true", "false"):
+                value = str(value).lower() == "true"
+        if not isinstance(value, bool):
+            raise ValueError("expected Bool")
+        return value
+
+    if data_type == PropertyDataType.String:
+        if coerce and not isinstance(value, str):
+            value = str(value)
+        if not isinstance(value, str):
+            raise ValueError("expected String")
+        return value
+
+    if data_type == PropertyDataType.Double:
+        if coerce and not isinstance(value, bool):
+            value = _to_number(value, float)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("expected Double")
+    elif data_type in _INTEGER_RANGES:
+        if coerce and not isinstance(value, bool):
+            value = _to_number(value, int)
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"expected {data_type.name}")
+
+        lowest, highest = _INTEGER_RANGES[data_type]
+        minimum = lowest if minimum is None else max(minimum, lowest)
+        maximum = highest if maximum is None else min(maximum, highest)
+    else:
+        return value
+
+    if minimum is not None and value < minimum:
+        if not coerce:
+            raise ValueError(f"below minimum {minimum}")
+        value = float(minimum) if data_type == PropertyDataType.Double else math.ceil(minimum)
+    if maximum is not None and value > maximum:
+        if not coerce:
+            raise ValueError(f"above maximum {maximum}")
+        value = float(maximum) if data_type == PropertyDataType.Double else math.floor(maximum)
+
+    return value
+
+
+def _to_number(value, number_type: type):
+    """
+    Converts value to number_type if that loses no information, otherwise returns value
+    """
+
+    if isinstance(value, number_type):
+        return value
+
+    try:
+        converted = number_type(float(value) if number_type is int else value)
+    except (TypeError, ValueError, OverflowError):
+        return value
+
+    if number_type is int and converted != float(value):
+        return value
+
+    return converted
+
+
+def validate_writes(device, writes: List[Tuple[str, object, str]], coerce: bool = False) -> list:
+    """
+    Validates (property, value, resources) writes of a Device in a single pass.
+
+    Missing property information is fetched in one batch, through the metadata cache of the
+    device. Returns the writes with coerced values, or raises PropertyValidationError listing
+    every invalid write.
+    """
+
+    keys = list(dict.fromkeys((property, resources) for property, _, resources in writes))
+    information = dict(zip(keys, device.get_property_information_batch(keys)))
+
+    validated = []
+    errors = []
+    for property, value, resources in writes:
+        info = information[(property, resources)]
+        if info.has_error():
+            errors.append((property, resources, value, info.error.get("message", info.error)))
+            continue
+
+        try:
+            validated.append((property, validate_value(info, value, coerce), resources))
+        except ValueError as error:
+            errors.append((property, resources, value, str(error)))
+
+    if errors:
+        raise PropertyValidationError(errors)
+
+    return validated
@@ -0,0 +1,27 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from slsc_web.arrays import NumpyGetPropertyResponse, to_numpy
+
+
+def test_array_value_dtype():
+    response = NumpyGetPropertyResponse(
+        {"id": "1", "jsonrpc": "2.0", "result": {"data_type": "Uint64Array", "value": [1, 2**63]}}
+    )
+
+    assert response.value.dtype == np.uint64
+    assert response.value[1] == 2**63
+    assert response.value is response.value
+
+
+def test_multi_resource_scalars_are_vector():
+    value = to_numpy("Double", [1.0, 2.5, 3.0])
+
+    assert value.dtype == np.float64
+    assert value.tolist() == [1.0, 2.5, 3.0]
+
+
+def test_single_scalar_and_unknown_type():
+    assert to_numpy("Int32", 7).dtype == np.int32
+    assert to_numpy("Unknown", [1, 2]) == [1, 2]
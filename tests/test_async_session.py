@@ -0,0 +1,83 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from slsc_web.async_session import AsyncDevice
+from slsc_web.protocols import close_pools, configure_executor, get_executor
+
+
+class CountingRPC:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def query(self, request):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+
+        result = {"session_id": "_session0", "data_type": "Int32", "value": 1}
+        return {"id": request.id, "jsonrpc": "2.0", "result": result}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def executors():
+    yield
+    close_pools()
+
+
+def test_async_device_limits_concurrency():
+    async def run():
+        dev = AsyncDevice("localhost", "Mod1", max_concurrency=4)
+        rpc = CountingRPC()
+        dev._rpc._rpc = rpc
+
+        async with dev:
+            responses = await asyncio.gather(*[dev.get_property("Dev.SlotNum") for _ in range(20)])
+
+        return rpc, responses
+
+    rpc, responses = asyncio.run(run())
+
+    assert all(response.value == 1 for response in responses)
+    assert rpc.peak == 4
+
+
+def test_async_devices_share_chassis_concurrency_limit():
+    async def run():
+        rpc = CountingRPC()
+        devs = [AsyncDevice("shared-chassis", "Mod1", max_concurrency=2) for _ in range(2)]
+        for dev in devs:
+            dev._rpc._rpc = rpc
+
+        for dev in devs:
+            await dev.open()
+        calls = [dev.get_property("Dev.SlotNum") for dev in devs for _ in range(10)]
+        await asyncio.gather(*calls)
+
+        return rpc
+
+    rpc = asyncio.run(run())
+
+    assert rpc.peak == 2
+
+
+def test_executor_size_is_configured_per_chassis():
+    AsyncDevice("sized-chassis", "Mod1", max_concurrency=2)
+
+    with pytest.raises(ValueError):
+        AsyncDevice("sized-chassis", "Mod1", max_concurrency=4)
+
+    configure_executor("sized-chassis", 4)
+    AsyncDevice("sized-chassis", "Mod1", max_concurrency=4)
+
+    assert get_executor("sized-chassis")._max_workers == 4
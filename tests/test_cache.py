@@ -0,0 +1,52 @@
+import time
+
+from slsc_web.cache import DiskMetadataStore, MetadataCache
+
+
+def test_cache_evicts_least_recently_used():
+    cache = MetadataCache(maxsize=2)
+    cache.put("SLSC-1", ("getPropertyInformation", "A", ("Mod1",)), 1)
+    cache.put("SLSC-1", ("getPropertyInformation", "B", ("Mod1",)), 2)
+    cache.get("SLSC-1", ("getPropertyInformation", "A", ("Mod1",)))
+    cache.put("SLSC-1", ("getPropertyInformation", "C", ("Mod1",)), 3)
+
+    assert cache.get("SLSC-1", ("getPropertyInformation", "A", ("Mod1",))) == 1
+    assert cache.get("SLSC-1", ("getPropertyInformation", "B", ("Mod1",))) is None
+    assert cache.statistics().evictions == 1
+
+
+def test_cache_expires_entries():
+    cache = MetadataCache(ttl=0.01)
+    cache.put("SLSC-1", ("getDevicePropertyList", ("Mod1",)), 1)
+    time.sleep(0.02)
+
+    assert cache.get("SLSC-1", ("getDevicePropertyList", ("Mod1",))) is None
+    assert len(cache) == 0
+
+
+def test_cache_invalidates_by_resource():
+    cache = MetadataCache()
+    cache.put("SLSC-1", ("getDevicePropertyList", ("Mod1",)), 1)
+    cache.put("SLSC-1", ("getDevicePropertyList", ("Mod2",)), 2)
+    cache.put("SLSC-2", ("getDevicePropertyList", ("Mod1",)), 3)
+
+    cache.invalidate("SLSC-1", ["Mod1"])
+
+    assert cache.get("SLSC-1", ("getDevicePropertyList", ("Mod1",))) is None
+    assert cache.get("SLSC-1", ("getDevicePropertyList", ("Mod2",))) == 2
+    assert cache.get("SLSC-2", ("getDevicePropertyList", ("Mod1",))) == 3
+
+    statistics = cache.statistics()
+    assert (statistics.hits, statistics.misses) == (2, 1)
+
+
+def test_disk_store_keyed_by_firmware(tmp_path):
+    store = DiskMetadataStore(str(tmp_path / "metadata.db"))
+    store.put("NI SLSC-12201", "1.0", ["getDevicePropertyList"], {"result": {"value": 1}})
+
+    reopened = DiskMetadataStore(str(tmp_path / "metadata.db"))
+
+    assert reopened.get("NI SLSC-12201", "1.0", ["getDevicePropertyList"]) == {
+        "result": {"value": 1}
+    }
+    assert reopened.get("NI SLSC-12201", "1.1", ["getDevicePropertyList"]) is None
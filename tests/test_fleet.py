@@ -0,0 +1,52 @@
+import time
+
+import slsc_web.fleet as fleet
+from slsc_web.responses import GenericResponse
+
+
+class FakeRPC:
+    def close(self):
+        pass
+
+
+class FakeDevice:
+    def __init__(self, chassis, devices):
+        if chassis == "offline":
+            raise OSError("unreachable")
+        self.chassis = chassis
+        self._session_id = "_session0"
+        self._rpc = FakeRPC()
+
+    def close(self):
+        return GenericResponse({"id": "1", "result": {}})
+
+    def reset_devices(self):
+        time.sleep(0.1)
+        if self.chassis == "faulty":
+            return GenericResponse({"id": "1", "error": {"code": -1, "message": "failed"}})
+        return GenericResponse({"id": "1", "result": {}})
+
+
+def test_fleet_runs_in_parallel(monkeypatch):
+    monkeypatch.setattr(fleet, "Device", FakeDevice)
+    chassis = {f"SLSC-{i}": f"SLSC-{i}" for i in range(8)}
+
+    with fleet.Fleet(chassis) as rack:
+        start = time.monotonic()
+        results = rack.reset_devices()
+        elapsed = time.monotonic() - start
+
+    assert set(results) == set(chassis)
+    assert results.ok()
+    assert elapsed < 0.5
+
+
+def test_fleet_reports_errors_per_chassis(monkeypatch):
+    monkeypatch.setattr(fleet, "Device", FakeDevice)
+
+    with fleet.Fleet({"offline": "Mod1", "faulty": "Mod1", "SLSC-1": "Mod1"}) as rack:
+        results = rack.reset_devices()
+        assert list(rack) == ["faulty", "SLSC-1"]
+
+    assert isinstance(rack.init_errors["offline"], OSError)
+    assert results.errors == {"faulty": {"code": -1, "message": "failed"}}
@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+
+from slsc_web import instrumentation
+from slsc_web.protocols import JSON_RPC, close_pools
+from slsc_web.requests import InitializeRequest
+from slsc_web.session import Device
+from slsc_web.simulator import Simulator
+
+
+@pytest.fixture
+def simulator():
+    with Simulator() as simulator:
+        yield simulator
+    instrumentation.disable()
+    close_pools()
+
+
+def test_records_calls_per_method_and_chassis(simulator):
+    metrics = instrumentation.enable()
+    records = []
+    metrics.add_exporter(records.append)
+    simulator.inject_error("getProperty", code=-7, count=1)
+
+    with Device(simulator.address, "Mod1") as dev:
+        dev.get_property("Dev.SlotNum")
+        dev.get_property("Dev.SlotNum")
+        simulator.inject_error("getPropertyInformation", code=-9, count=1)
+        with dev.batch() as batch:
+            batch.get_property("Dev.Temperature")
+            batch.get_property_information("Dev.Temperature")
+
+    methods = metrics.by_method()
+    assert methods["getProperty"].count == 3
+    assert methods["getPropertyInformation"].count == 1
+    assert "batch" not in methods
+    assert [record.transport for record in records].count("batch") == 2
+    assert metrics.by_chassis()[simulator.address].count == len(records) == 6
+    assert metrics.errors() == {
+        (simulator.address, "getProperty", -7): 1,
+        (simulator.address, "getPropertyInformation", -9): 1,
+    }
+    assert all(record.request_bytes > 0 and record.response_bytes > 0 for record in records)
+    assert metrics.phases()[(simulator.address, "getProperty")]["network"] > 0
+
+    text = metrics.to_prometheus()
+    labels = f'chassis="{simulator.address}",method="getProperty"'
+    count = f'slsc_request_duration_seconds_count{{{labels},transport="single"}} 2'
+    errors = f'slsc_request_errors_total{{{labels},code="-7"}} 1'
+    assert count in text
+    assert errors in text
+
+
+def test_logging_exporter_and_disable(simulator, caplog):
+    metrics = instrumentation.enable()
+    metrics.add_exporter(instrumentation.logging_exporter(level=logging.INFO))
+
+    with caplog.at_level(logging.INFO, logger="slsc_web.instrumentation"):
+        dev = Device(simulator.address, "Mod1")
+        instrumentation.disable()
+        dev.get_property("Dev.SlotNum")
+
+    assert len(caplog.records) == 1
+    assert "initializeSession" in caplog.records[0].getMessage()
+    assert metrics.by_method().keys() == {"initializeSession"}
+
+
+def test_histogram_quantile():
+    histogram = instrumentation.Histogram((0.001, 0.01, 0.1))
+    for value in (0.0005, 0.002, 0.003, 0.05, 5.0):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(0.99) == float("inf")
+
+
+def test_records_transport_errors():
+    metrics = instrumentation.enable()
+    rpc = JSON_RPC("127.0.0.1:1")
+    try:
+        with pytest.raises(Exception) as error:
+            rpc.query(InitializeRequest(1, "Mod1"))
+    finally:
+        instrumentation.disable()
+        close_pools()
+
+    name = type(error.value).__name__
+    assert metrics.errors() == {("127.0.0.1:1", "initializeSession", name): 1}
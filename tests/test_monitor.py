@@ -0,0 +1,70 @@
+import itertools
+import time
+
+from slsc_web.monitor import PropertyMonitor
+from slsc_web.responses import GetPropertyResponse
+
+
+class FakeSession:
+    def __init__(self, values, delay=0.0):
+        self._session_id = "_session0"
+        self._resources = "Mod1"
+        self._values = iter(values)
+        self._delay = delay
+        self._ids = itertools.count(1)
+
+    def _get_uid(self):
+        return next(self._ids)
+
+    def _query_batch(self, requests):
+        time.sleep(self._delay)
+        value = next(self._values)
+        return [{"id": request.id, "result": {"value": value}} for request in requests]
+
+
+def test_monitor_batches_properties():
+    monitor = PropertyMonitor(FakeSession([1, 2]), ["Dev.A", "Dev.B"], rate=100)
+
+    sample = next(monitor)
+
+    assert sample.values == {"Dev.A": 1, "Dev.B": 1}
+    assert sample.missed == 0
+
+
+def test_monitor_change_only():
+    monitor = PropertyMonitor(FakeSession([1, 1, 1, 2]), "Dev.A", rate=1000, change_only=True)
+
+    assert [next(monitor).values, next(monitor).values] == [{"Dev.A": 1}, {"Dev.A": 2}]
+
+
+def test_monitor_reports_missed_deadlines():
+    monitor = PropertyMonitor(FakeSession(range(10), delay=0.035), "Dev.A", rate=100)
+
+    samples = [next(monitor) for _ in range(3)]
+
+    assert samples[0].missed == 0
+    assert samples[1].missed >= 2
+    assert monitor.missed == sum(sample.missed for sample in samples)
+
+
+def test_monitor_reports_results_without_value():
+    class PartialSession(FakeSession):
+        def _query_batch(self, requests):
+            return [{"id": request.id, "result": {}} for request in requests]
+
+    sample = next(PropertyMonitor(PartialSession([]), "Dev.A", rate=1000))
+
+    assert sample.values == {}
+    assert sample.errors["Dev.A"]["code"] == -32603
+
+
+def test_monitor_decodes_with_session_response_type():
+    class NamedResponse(GetPropertyResponse):
+        @property
+        def value(self):
+            return f"decoded {self._result['value']}"
+
+    session = FakeSession([1])
+    session._property_response = NamedResponse
+
+    assert next(PropertyMonitor(session, "Dev.A", rate=1000)).values == {"Dev.A": "decoded 1"}
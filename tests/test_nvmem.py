@@ -0,0 +1,106 @@
+import slsc_web.session as session
+from slsc_web.nvmem import NvmemImage, NvmemMirror, changed_ranges
+
+
+def test_changed_ranges_merges_small_gaps():
+    old = bytes(200)
+    new = bytearray(old)
+    new[3] = new[5] = 1
+    new[150:152] = b"\x01\x02"
+
+    assert changed_ranges(old, new) == [(3, 4), (5, 6), (150, 152)]
+    assert changed_ranges(old, new, max_gap=2) == [(3, 6), (150, 152)]
+
+
+class NvmemRPC:
+    def __init__(self, chassis):
+        self.memory = bytearray(range(256)) * 4
+        self.methods = []
+
+    def query(self, request):
+        self.methods.append(request._get_method())
+        return {"id": request.id, "result": {"session_id": "_session0"}}
+
+    def query_batch(self, requests):
+        results = []
+        for request in requests:
+            self.methods.append(request._get_method())
+            params = request._request_dict["params"]
+            offset = params["offset"]
+            if "count" in params:
+                result = {"bytes": list(self.memory[offset : offset + params["count"]])}
+            else:
+                self.memory[offset : offset + len(params["bytes"])] = bytes(params["bytes"])
+                result = {}
+            results.append({"id": request.id, "result": result})
+        return results
+
+
+def test_nvmem_image_writes_only_changes(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", NvmemRPC)
+    areas = session.NvmemAreas("SLSC-1", "Mod1/Calibration")
+    image = NvmemImage(areas, 1024, chunk_size=100)
+
+    assert image.load() == []
+    assert bytes(image.data) == bytes(areas._rpc.memory)
+
+    image[10:12] = b"\xff\xff"
+    image[700] = 0
+    areas._rpc.methods.clear()
+    image.sync()
+
+    assert areas._rpc.methods == ["setNvmemBytes", "setNvmemBytes", "commitNvmemAreas"]
+    assert areas._rpc.memory[10:12] == b"\xff\xff"
+    assert image.changes() == []
+
+
+def test_nvmem_image_commits_after_uncommitted_sync(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", NvmemRPC)
+    areas = session.NvmemAreas("SLSC-1", "Mod1/Calibration")
+    image = NvmemImage(areas, 1024)
+    image.load()
+
+    image[10] = 0
+    areas._rpc.methods.clear()
+    image.sync(commit=False)
+
+    assert image.changes() == [(10, 11)]
+
+    image.sync()
+
+    assert areas._rpc.methods == ["setNvmemBytes", "setNvmemBytes", "commitNvmemAreas"]
+    assert image.changes() == []
+
+
+def test_nvmem_mirror_syncs_incrementally(monkeypatch, tmp_path):
+    monkeypatch.setattr(session, "JSON_RPC", NvmemRPC)
+    areas = session.NvmemAreas("SLSC-1", "Mod1/Calibration,Mod1/User")
+    path = str(tmp_path / "Mod1.nvmem")
+    layout = {"Mod1/Calibration": 512, "Mod1/User": 64}
+
+    with NvmemMirror(path, layout) as mirror:
+        assert mirror.refresh(areas) == {"Mod1/Calibration": [], "Mod1/User": []}
+        assert mirror.refresh(areas) == {}
+
+        mirror["Mod1/User"][0] = 255
+        areas._rpc.methods.clear()
+        mirror.push(areas)
+
+        assert areas._rpc.methods == ["setNvmemBytes", "commitNvmemAreas"]
+        assert mirror.generation("Mod1/User") == 2
+
+    with NvmemMirror(path, layout) as mirror:
+        assert mirror.stale_areas() == []
+        assert mirror["Mod1/User"][0] == 255
+
+
+def test_nvmem_mirror_closes_with_outstanding_views(monkeypatch, tmp_path):
+    monkeypatch.setattr(session, "JSON_RPC", NvmemRPC)
+    areas = session.NvmemAreas("SLSC-1", "Mod1/User")
+    path = str(tmp_path / "Mod1.nvmem")
+
+    with NvmemMirror(path, {"Mod1/User": 64}) as mirror:
+        mirror.refresh(areas)
+        user = mirror["Mod1/User"]
+
+    assert bytes(user) == bytes(areas._rpc.memory[:64])
@@ -0,0 +1,141 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import slsc_web.protocols as protocols
+import slsc_web.requests as requests
+from slsc_web.protocols import (
+    JSON_RPC,
+    _match_batch_responses,
+    close_pools,
+    configure_pool,
+    get_pool,
+    pool_statistics,
+)
+from slsc_web.session import Device
+
+
+def test_batch_responses_out_of_order():
+    batch = [requests.CloseRequest(1, "_session0"), requests.CloseRequest(2, "_session1")]
+    data = [
+        {"id": "2", "jsonrpc": "2.0", "result": {}},
+        {"id": "1", "jsonrpc": "2.0", "result": {}},
+    ]
+
+    results = _match_batch_responses(batch, data)
+
+    assert [result["id"] for result in results] == ["1", "2"]
+
+
+def test_batch_responses_missing_entry():
+    batch = [requests.CloseRequest(1, "_session0"), requests.CloseRequest(2, "_session1")]
+    data = [{"id": "1", "jsonrpc": "2.0", "result": {}}]
+
+    results = _match_batch_responses(batch, data)
+
+    assert "error" not in results[0]
+    assert results[1]["id"] == "2"
+    assert results[1]["error"]["code"] == -32603
+
+
+def test_batch_responses_single_error():
+    batch = [requests.CloseRequest(1, "_session0"), requests.CloseRequest(2, "_session1")]
+    data = {"id": None, "jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}}
+
+    results = _match_batch_responses(batch, data)
+
+    assert [result["id"] for result in results] == ["1", "2"]
+    assert all(result["error"]["code"] == -32700 for result in results)
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        property = request["params"].get("property")
+        id = "0" if property == "Dev.WrongId" else request["id"]
+        body = json.dumps({"id": id, "jsonrpc": "2.0", "result": {"value": property}}).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def chassis():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    close_pools()
+
+
+def test_sessions_share_connection_pool(chassis):
+    first, second = JSON_RPC(chassis), JSON_RPC(chassis)
+    for id in range(5):
+        first.query(requests.CloseRequest(id, "_session0"))
+        second.query(requests.CloseRequest(id, "_session1"))
+
+    statistics = pool_statistics(chassis)
+
+    assert statistics.requests == 10
+    assert statistics.new_connections == 1
+    assert statistics.reuses == 9
+
+
+def test_configure_pool(chassis):
+    configure_pool(chassis, maxsize=2, block=True)
+
+    assert get_pool(chassis).pool.maxsize == 2
+    assert get_pool(chassis).block
+
+
+def test_query_retries_on_pool_closed_by_configure(chassis, monkeypatch):
+    closed = get_pool(chassis)
+    configure_pool(chassis, maxsize=2)
+    pools = [closed]
+    monkeypatch.setattr(
+        protocols, "get_pool", lambda name: pools.pop() if pools else get_pool(name)
+    )
+
+    response = JSON_RPC(chassis).query(requests.GetPropertyRequest(1, "_session0", "P", "Mod1"))
+
+    assert response["result"]["value"] == "P"
+
+
+def test_query_rejects_mismatched_response_id(chassis):
+    rpc = JSON_RPC(chassis)
+
+    response = rpc.query(requests.GetPropertyRequest(7, "_session0", "Dev.WrongId", "Mod1"))
+
+    assert response["id"] == "7"
+    assert response["error"]["code"] == -32603
+
+
+def test_session_shared_between_threads(chassis):
+    configure_pool(chassis, maxsize=8, block=True)
+    dev = Device(chassis, "Mod1")
+
+    def read(thread: int) -> list:
+        responses = [dev.get_property(f"P{thread}.{index}") for index in range(25)]
+        return [(response.value, response._id, response.has_error()) for response in responses]
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = [entry for entries in executor.map(read, range(32)) for entry in entries]
+
+    assert not any(error for _, _, error in results)
+    assert [value for value, _, _ in results] == [
+        f"P{thread}.{index}" for thread in range(32) for index in range(25)
+    ]
+    assert len({id for _, id, _ in results}) == 32 * 25
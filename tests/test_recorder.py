@@ -0,0 +1,64 @@
+import pytest
+
+from slsc_web.recorder import PropertyRecorder, RingBuffer
+
+
+def test_ring_buffer_wraps():
+    buffer = RingBuffer("d", 3)
+    for value in range(5):
+        buffer.append(value)
+
+    older, newer = buffer.views()
+
+    assert len(buffer) == 3
+    assert older.tolist() == [2.0]
+    assert newer.tolist() == [3.0, 4.0]
+    assert buffer.tolist() == [2.0, 3.0, 4.0]
+
+
+def test_recorder_splits_resources():
+    with PropertyRecorder(capacity=4) as recorder:
+        recorder.record("AI.Voltage", "Mod1,Mod2", "Double", [1.5, 2.5], timestamp=10.0)
+        recorder.record("AI.Voltage", "Mod1,Mod2", "Double", [1.75, 2.75], timestamp=11.0)
+
+        series = recorder["AI.Voltage", "Mod2"]
+        assert series.values.tolist() == [2.5, 2.75]
+        assert series.timestamps.tolist() == [10.0, 11.0]
+
+
+def test_recorder_spills_to_file(tmp_path):
+    with PropertyRecorder(capacity=2, spill_directory=str(tmp_path)) as recorder:
+        for value in (True, False, True):
+            recorder.record("DO.State", "Mod1/do0", "Bool", value)
+
+        assert recorder["DO.State", "Mod1/do0"].values.tolist() == [False, True]
+        (values,) = tmp_path.glob("DO.State_Mod1_do0_*.values")
+        assert values.stat().st_size == 32 + 2
+
+
+def test_recorder_keeps_similar_names_in_separate_files(tmp_path):
+    with PropertyRecorder(capacity=2, spill_directory=str(tmp_path)) as recorder:
+        recorder.record("AI.Voltage", "Mod1/ai0", "Double", 1.0)
+        recorder.record("AI.Voltage", "Mod1_ai0", "Double", 2.0)
+
+        assert recorder["AI.Voltage", "Mod1/ai0"].values.tolist() == [1.0]
+        assert recorder["AI.Voltage", "Mod1_ai0"].values.tolist() == [2.0]
+        assert len(list(tmp_path.glob("*.values"))) == 2
+
+
+def test_ring_buffer_file_keeps_order_and_resumes(tmp_path):
+    path = str(tmp_path / "values")
+    buffer = RingBuffer("d", 3, path)
+    for value in range(5):
+        buffer.append(value)
+    buffer.close()
+
+    buffer = RingBuffer.from_file(path)
+    assert buffer.tolist() == [2.0, 3.0, 4.0]
+
+    buffer.append(5)
+    assert buffer.tolist() == [3.0, 4.0, 5.0]
+    buffer.close()
+
+    with pytest.raises(ValueError):
+        RingBuffer("i", 3, path)
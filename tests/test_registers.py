@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+import slsc_web.session as session
+from slsc_web.registers import RegisterMap
+
+REGISTERS = {
+    "CTRL": {"address": "0x10", "width": 16, "fields": {"EN": "0x1", "MODE": "0x6"}},
+    "STATUS": {"address": 20},
+}
+
+
+def test_register_map_lookups(tmp_path):
+    path = tmp_path / "registers.json"
+    path.write_text(json.dumps(REGISTERS))
+    registers = RegisterMap.load(str(path))
+
+    control = registers["CTRL"]
+    assert registers.at(0x10) is control
+    assert control.fields["MODE"].shift == 1
+    assert control.set(0b1000, EN=1, MODE=2) == 0b1101
+    assert control.get(0b1101, "MODE") == 2
+    with pytest.raises(ValueError):
+        control.set(0, MODE=4)
+
+
+class RegisterRPC:
+    def __init__(self, chassis):
+        self.registers = {0x10: 0b1, 20: 7}
+        self.writes = []
+
+    def query(self, request):
+        return {"id": request.id, "result": {"session_id": "_session0"}}
+
+    def query_batch(self, requests):
+        results = []
+        for request in requests:
+            params = request._request_dict["params"]
+            if request._get_method() == "writeRegister":
+                self.writes.append((params["address"], params["value"]))
+                self.registers[params["address"]] = params["value"]
+            value = self.registers[params["address"]]
+            results.append({"id": request.id, "result": {"value": value}})
+        return results
+
+
+def test_update_registers_skips_unchanged(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", RegisterRPC)
+    dev = session.Device("SLSC-1", "Mod1")
+    registers = RegisterMap(REGISTERS)
+
+    values = dev.update_registers({registers["CTRL"]: {"EN": 1, "MODE": 3}})
+    dev.update_register(registers["CTRL"], MODE=3)
+
+    assert values[registers["CTRL"]] == 0b111
+    assert dev._rpc.writes == [(0x10, 0b111)]
+    assert list(dev.read_registers([0x10, 20])) == [0b111, 7]
@@ -99,3 +99,53 @@ def test_get_property_information():
 
     result = r'{"id": "3", "jsonrpc": "2.0", "method": "getPropertyInformation", "params": {"devices": ["TSE2"], "session_id": "_session7", "property": "Dev.Modules"}}'
     assert message.serialize() == result
+
+
+def test_request_template():
+    message = requests.GetPropertyRequest(0, "_session7", "Dev.Modules", "TSE2,TSE3")
+    template = requests.RequestTemplate(message)
+
+    result = r'{"id": "12", "jsonrpc": "2.0", "method": "getProperty", "params": {"devices": ["TSE2", "TSE3"], "session_id": "_session7", "property": "Dev.Modules"}}'
+    assert template.bind(12).serialize() == result
+    assert template.bind(12).id == "12"
+
+
+def test_set_property():
+    message = requests.SetPropertyRequest(5, "_session3", "AO.Voltage", 2.5, "Mod1/ao0,Mod1/ao1")
+
+    result = r'{"id": "5", "jsonrpc": "2.0", "method": "setProperty", "params": {"devices": ["Mod1/ao0", "Mod1/ao1"], "session_id": "_session3", "property": "AO.Voltage", "value": 2.5}}'
+    assert message.serialize() == result
+
+
+def test_write_register():
+    message = requests.WriteRegisterRequest(6, "_session1", "Mod3", 16, 255)
+
+    result = r'{"id": "6", "jsonrpc": "2.0", "method": "writeRegister", "params": {"session_id": "_session1", "device": "Mod3", "address": 16, "value": 255}}'
+    assert message.serialize() == result
+
+
+def test_execute_command():
+    message = requests.ExecuteCommandRequest(2, "_session5", "SelfCalibrate", "Mod1,Mod2")
+
+    result = r'{"id": "2", "jsonrpc": "2.0", "method": "executeCommand", "params": {"session_id": "_session5", "devices": ["Mod1", "Mod2"], "command": "SelfCalibrate"}}'
+    assert message.serialize() == result
+
+
+def test_expand_channels():
+    assert requests.expand_channels("Mod1/ch0:2,Mod2/ch7,Mod3/ch1:0") == (
+        "Mod1/ch0",
+        "Mod1/ch1",
+        "Mod1/ch2",
+        "Mod2/ch7",
+        "Mod3/ch1",
+        "Mod3/ch0",
+    )
+
+
+def test_resource_set_is_accepted_by_requests():
+    resources = requests.ResourceSet("Mod1,Mod2,Mod1")
+    request = requests.GetPropertyRequest(1, "_session0", "Dev.SlotNum", devices=resources)
+
+    assert str(resources) == "Mod1,Mod2"
+    assert requests.split_resources(resources) is resources.names
+    assert '"devices": ["Mod1", "Mod2"]' in request.serialize()
@@ -0,0 +1,49 @@
+from slsc_web.responses import (
+    GetPropertyInformationResponse,
+    GetPropertyListResponse,
+    GetPropertyResponse,
+    PropertyDataType,
+)
+
+
+def test_property_response_fields():
+    response = GetPropertyResponse(
+        {"id": "3", "jsonrpc": "2.0", "result": {"data_type": "Double", "value": 1.5}}
+    )
+
+    assert response.id == "3"
+    assert response.data_type == "Double"
+    assert response.value == 1.5
+
+
+def test_error_response_defaults():
+    response = GetPropertyListResponse(
+        {"id": "3", "jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}}
+    )
+
+    assert response.has_error()
+    assert response.static_properties == []
+    assert response.dynamic_properties == []
+
+
+def test_fields_are_decoded_once():
+    response = GetPropertyListResponse(
+        {"id": "3", "jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}}
+    )
+
+    response.static_properties.append("Dev.SerialNum")
+
+    assert response.static_properties is response.static_properties
+    assert response.static_properties == ["Dev.SerialNum"]
+
+
+def test_property_information_data_type():
+    response = GetPropertyInformationResponse(
+        {"id": "3", "jsonrpc": "2.0", "result": {"data_type": "Uint32", "min_value": 0}}
+    )
+
+    assert response.data_type is PropertyDataType.Uint32
+    assert response.minimum_value == 0
+
+    response.data_type = "Bool"
+    assert response.data_type is PropertyDataType.Bool
@@ -0,0 +1,190 @@
+import json
+import time
+
+import slsc_web.session as session
+from slsc_web.cache import DiskMetadataStore, MetadataCache, ValueCache
+from slsc_web.session import Batch
+from slsc_web.responses import GetPropertyResponse
+
+
+class FakeRPC:
+    """
+    Stand-in for JSON_RPC answering every request with the same result
+    """
+
+    result = {
+        "session_id": "_session0",
+        "data_type": "Int32",
+        "value": 1,
+        "static_properties": ["Dev.SerialNum"],
+        "dynamic_properties": ["Dev.Temperature"],
+    }
+
+    def __init__(self, chassis, *args, **kwargs):
+        self.methods = []
+        self.requests = []
+
+    def query(self, request):
+        self.methods.append(request._get_method())
+        self.requests.append(json.loads(request.serialize()))
+        return {"id": request.id, "jsonrpc": "2.0", "result": self.result}
+
+    def query_batch(self, requests):
+        return [self.query(request) for request in requests]
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self):
+        self._session_id = "_session0"
+        self._resources = "Mod1,Mod2"
+        self._uid = 0
+        self.batches = []
+
+    def _get_uid(self):
+        self._uid += 1
+        return self._uid
+
+    def _query_batch(self, requests):
+        self.batches.append(requests)
+        return [
+            {"id": request.id, "jsonrpc": "2.0", "result": {"data_type": "Int32", "value": 1}}
+            for request in requests
+        ]
+
+
+def test_batch_sends_in_chunks():
+    session = FakeSession()
+
+    with Batch(session, max_size=2) as batch:
+        pending = [batch.get_property("Dev.SlotNum") for _ in range(5)]
+
+    assert [len(requests) for requests in session.batches] == [2, 2, 1]
+    assert all(isinstance(p.response, GetPropertyResponse) for p in pending)
+    assert pending[4].response.value == 1
+
+
+def test_device_caches_property_information(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", FakeRPC)
+    dev = session.Device("SLSC-1", "Mod1", metadata_cache=MetadataCache())
+
+    dev.get_property_information("Dev.SlotNum")
+    dev.get_property_information("Dev.SlotNum")
+    dev.reset_devices()
+    dev.get_property_information("Dev.SlotNum")
+
+    assert dev._rpc.methods.count("getPropertyInformation") == 2
+
+
+def test_device_loads_metadata_from_disk(monkeypatch, tmp_path):
+    monkeypatch.setattr(session, "JSON_RPC", FakeRPC)
+    store = DiskMetadataStore(str(tmp_path / "metadata.db"))
+
+    first = session.Device("SLSC-1", "Mod1", metadata_cache=MetadataCache(store=store))
+    first.get_property_information("Dev.SlotNum")
+    second = session.Device("SLSC-1", "Mod1", metadata_cache=MetadataCache(store=store))
+    response = second.get_property_information("Dev.SlotNum")
+
+    assert first._rpc.methods.count("getPropertyInformation") == 1
+    assert second._rpc.methods.count("getPropertyInformation") == 0
+    assert response.data_type.name == "Int32"
+
+
+def test_device_shares_command_list_between_identical_modules(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", FakeRPC)
+    cache = MetadataCache()
+    first = session.Device("SLSC-1", "Mod1,Mod2", metadata_cache=cache)
+    second = session.Device("SLSC-2", "Mod1", metadata_cache=cache)
+
+    first.get_command_list("Mod1")
+    first.get_command_list("Mod2")
+    second.get_command_list()
+
+    assert first._rpc.methods.count("getCommandList") == 1
+    assert second._rpc.methods.count("getCommandList") == 0
+
+
+def test_device_caches_static_values_only(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", FakeRPC)
+    dev = session.Device("SLSC-1", "Mod1", value_cache=ValueCache())
+
+    for _ in range(3):
+        dev.get_property("Dev.SerialNum")
+        dev.get_property("Dev.Temperature")
+    dev.commit_properties()
+    dev.get_property("Dev.SerialNum")
+
+    assert dev._rpc.methods.count("getProperty") == 3 + 1 + 1
+
+
+def test_write_buffer_coalesces_writes(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", FakeRPC)
+    dev = session.Device("SLSC-1", "Mod1,Mod2")
+
+    with dev.write_buffer() as writes:
+        writes.set("AO.Voltage", 1.0, "Mod1")
+        writes.set("AO.Voltage", 2.0)
+        writes.set("AO.Enable", True, "Mod2")
+        writes.set("AO.Voltage", 3.0, "Mod2")
+
+    sent = [request["params"] for request in dev._rpc.requests[1:]]
+    assert [
+        (params.get("property"), params.get("value"), params["devices"]) for params in sent
+    ] == [
+        ("AO.Voltage", 2.0, ["Mod1"]),
+        ("AO.Voltage", 3.0, ["Mod2"]),
+        ("AO.Enable", True, ["Mod2"]),
+        (None, None, ["Mod1", "Mod2"]),
+    ]
+    assert dev._rpc.methods[-1] == "commitProperties"
+
+
+def test_start_command_runs_devices_concurrently(monkeypatch):
+    class SlowRPC(FakeRPC):
+        def query(self, request):
+            if request._get_method() == "executeCommand":
+                time.sleep(0.2)
+            return super().query(request)
+
+    monkeypatch.setattr(session, "JSON_RPC", SlowRPC)
+    dev = session.Device("SLSC-1", "Mod1,Mod2,Mod3,Mod4")
+
+    start = time.monotonic()
+    handle = dev.start_command("SelfCalibrate")
+    results = handle.result(timeout=5)
+
+    assert time.monotonic() - start < 0.6
+    assert list(results) == ["Mod1", "Mod2", "Mod3", "Mod4"]
+    assert handle.errors() == {}
+
+
+def test_physical_channels_columnar_reads_and_grouped_writes(monkeypatch):
+    class ChannelRPC(FakeRPC):
+        result = dict(FakeRPC.result, value=[1, 2, 3, 4])
+
+    monkeypatch.setattr(session, "JSON_RPC", ChannelRPC)
+    channels = session.PhysicalChannels("SLSC-1", "Mod1/ch0:3")
+
+    values = channels.get_property("AO.Voltage")
+    channels.set_values("AO.Voltage", [0.0, 1.0, 0.0, 1.0])
+
+    assert values.channels == ("Mod1/ch0", "Mod1/ch1", "Mod1/ch2", "Mod1/ch3")
+    assert values.get("Mod1/ch2") == 3
+    sent = [request["params"] for request in channels._rpc.requests]
+    assert sent[1]["physical_channels"] == list(values.channels)
+    assert [(params["value"], params["physical_channels"]) for params in sent[2:]] == [
+        (0.0, ["Mod1/ch0", "Mod1/ch2"]),
+        (1.0, ["Mod1/ch1", "Mod1/ch3"]),
+    ]
+
+
+def test_set_values_keeps_value_types_apart(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", FakeRPC)
+    channels = session.PhysicalChannels("SLSC-1", "Mod1/ch0:2")
+
+    channels.set_values("AO.Voltage", [1.0, True, 1])
+
+    sent = [request["params"]["value"] for request in channels._rpc.requests[1:]]
+    assert [(type(value), value) for value in sent] == [(float, 1.0), (bool, True), (int, 1)]
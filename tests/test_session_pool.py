@@ -0,0 +1,94 @@
+import pytest
+
+import slsc_web.session_pool as session_pool
+from slsc_web.responses import GenericResponse
+
+
+class FakeDevice:
+    created = 0
+
+    def __init__(self, chassis, devices, **options):
+        FakeDevice.created += 1
+        self._session_id = f"_session{FakeDevice.created}"
+        self.closed = False
+        self.healthy = True
+        self.calls = []
+
+    def _response(self, ok=True):
+        if ok:
+            return GenericResponse({"id": "1", "result": {}})
+        return GenericResponse({"id": "1", "error": {"code": -1, "message": "failed"}})
+
+    def connect(self):
+        self.calls.append("connect")
+        return self._response()
+
+    def reserve_devices(self):
+        self.calls.append("reserve")
+        return self._response()
+
+    def get_session_properties(self):
+        return self._response(self.healthy)
+
+    def close(self):
+        self.closed = True
+        return self._response()
+
+
+class FakeRPC:
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    FakeDevice._rpc = FakeRPC()
+    monkeypatch.setattr(session_pool, "Device", FakeDevice)
+    FakeDevice.created = 0
+    with session_pool.SessionPool() as pool:
+        yield pool
+
+
+def test_pool_reuses_sessions(pool):
+    with pool.lease("SLSC-1", "Mod1", connect=True, reserve=True) as first:
+        pass
+    with pool.lease("SLSC-1", "Mod1", connect=True, reserve=True) as second:
+        pass
+
+    assert first is second
+    assert first.calls == ["connect", "reserve"]
+    assert FakeDevice.created == 1
+
+
+def test_pool_replaces_unhealthy_sessions(pool):
+    with pool.lease("SLSC-1", "Mod1") as first:
+        first.healthy = False
+    with pool.lease("SLSC-1", "Mod1") as second:
+        pass
+
+    assert first.closed
+    assert second is not first
+
+
+def test_pool_closes_sessions_on_error_and_shutdown(pool):
+    with pytest.raises(ValueError):
+        with pool.lease("SLSC-1", "Mod1") as failed:
+            raise ValueError()
+    with pool.lease("SLSC-1", "Mod2") as idle:
+        pass
+
+    pool.close()
+
+    assert failed.closed
+    assert idle.closed
+
+
+def test_pool_closes_expired_sessions_on_acquire(pool):
+    pool._idle_timeout = 0.0
+    with pool.lease("SLSC-1", "Mod1", reserve=True) as expired:
+        pass
+    with pool.lease("SLSC-1", "Mod1", reserve=True) as second:
+        pass
+
+    assert expired.closed
+    assert second is not expired
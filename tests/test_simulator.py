@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from slsc_web.protocols import close_pools
+from slsc_web.session import Device, NvmemAreas, PhysicalChannels
+from slsc_web.simulator import Simulator
+from slsc_web.topology import Topology
+
+
+@pytest.fixture
+def simulator():
+    with Simulator(seed=1) as simulator:
+        yield simulator
+    close_pools()
+
+
+def test_device_round_trip(simulator):
+    with Device(simulator.address, "Mod1,Mod2") as dev:
+        slots = dev.get_property("Dev.SlotNum")
+        dev.set_property("Dev.Label", "left", "Mod1")
+        information = dev.get_property_information("Dev.Temperature")
+        read_only = dev.set_property("Dev.SlotNum", 5)
+
+    assert slots.value == [1, 2]
+    assert simulator.value("Mod1", "Dev.Label") == "left"
+    assert information.unit == "C"
+    assert read_only.has_error()
+
+
+def test_channels_write_on_commit(simulator):
+    with PhysicalChannels(simulator.address, "Mod1/ch0:3") as channels:
+        channels.set_values("AO.Voltage", [1.0, 2.0, 1.0, 2.0])
+        before = channels.get_property("AO.Voltage")
+        channels.commit_properties()
+        after = channels.get_property("AO.Voltage")
+
+    assert before.values == [0.0] * 4
+    assert after.values == [1.0, 2.0, 1.0, 2.0]
+
+
+def test_nvmem_round_trip(simulator):
+    with NvmemAreas(simulator.address, "Mod2/nvmem0") as areas:
+        areas.set_nvmem_bytes(10, b"\x01\x02\x03")
+        areas.commit_nvmem_areas()
+        response = areas.get_nvmem_bytes(9, 5)
+
+    assert response.data == [0, 1, 2, 3, 0]
+
+
+def test_topology_of_simulated_chassis(simulator):
+    topology = Topology.discover(simulator.address, chassis_device="SLSC-Sim")
+
+    assert str(topology.devices) == "Mod1,Mod2"
+    assert len(topology.channels) == 16
+
+
+def test_error_injection_and_batches():
+    simulator = Simulator(seed=1)
+    session_id = simulator.call(
+        {"id": "1", "method": "initializeSession", "params": {"devices": ["Mod1"]}}
+    )["result"]["session_id"]
+    simulator.inject_error("getProperty", code=-5, count=1)
+
+    request = {
+        "method": "getProperty",
+        "params": {"session_id": session_id, "devices": ["Mod1"], "property": "Dev.SlotNum"},
+    }
+    responses = simulator.call(
+        [dict(request, id="2"), dict(request, id="3"), {"id": "4", "method": "noSuchMethod"}]
+    )
+
+    assert [response["id"] for response in responses] == ["2", "3", "4"]
+    assert responses[0]["error"]["code"] == -5
+    assert responses[1]["result"]["value"] == 1
+    assert responses[2]["error"]["code"] == -32601
+
+
+def test_latency_injection():
+    simulator = Simulator(latency=0.02, method_latency={"closeSession": 0.03})
+
+    start = time.monotonic()
+    simulator.call({"id": "1", "method": "closeSession", "params": {"session_id": "x"}})
+
+    assert time.monotonic() - start >= 0.05
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+import slsc_web.session as session
+from slsc_web.requests import ResourceSet
+from slsc_web.topology import Topology, TopologyError
+
+
+class TopologyRPC:
+    values = {
+        "Dev.Modules": ["Mod1", "Mod2"],
+        "Dev.SlotNum": {"Mod1": 1, "Mod2": 2},
+        "Dev.PhysicalChannels": {"Mod1": 2, "Mod2": ["Mod2/ai0", "Mod2/ai1"]},
+    }
+
+    def __init__(self, chassis, *args, **kwargs):
+        pass
+
+    def query(self, request):
+        params = json.loads(request.serialize())["params"]
+        value = self.values.get(params.get("property"))
+        if isinstance(value, dict):
+            value = value[params["devices"][0]]
+        if params.get("property") and value is None:
+            return {"id": request.id, "error": {"code": -1, "message": "unknown property"}}
+        return {"id": request.id, "result": {"session_id": "_session0", "value": value}}
+
+    def query_batch(self, requests):
+        return [self.query(request) for request in requests]
+
+    def close(self):
+        pass
+
+
+def test_discover_indexes_modules_and_channels(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", TopologyRPC)
+
+    topology = Topology.discover("SLSC-1")
+
+    assert topology.devices == ResourceSet("Mod1,Mod2")
+    assert topology[2].name == "Mod2"
+    assert topology["Mod1/ch1"].slot == 1
+    assert str(topology.channels_of("Mod2,Mod1")) == "Mod2/ai0,Mod2/ai1,Mod1/ch0,Mod1/ch1"
+
+
+def test_discover_raises_on_errors(monkeypatch):
+    monkeypatch.setattr(session, "JSON_RPC", TopologyRPC)
+
+    with pytest.raises(TopologyError) as error:
+        Topology.discover("SLSC-1", slot_property="Dev.Unknown")
+
+    assert set(error.value.errors) == {"Mod1", "Mod2"}
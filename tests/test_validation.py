@@ -0,0 +1,66 @@
+import pytest
+
+from slsc_web.responses import GetPropertyInformationResponse
+from slsc_web.validation import PropertyValidationError, validate_value, validate_writes
+
+
+def information(data_type, access="ReadWrite", minimum=None, maximum=None):
+    result = {"data_type": data_type, "access": access, "min_value": minimum, "max_value": maximum}
+    return GetPropertyInformationResponse({"id": "1", "jsonrpc": "2.0", "result": result})
+
+
+def test_rejects_read_only_and_out_of_range():
+    with pytest.raises(ValueError, match="ReadOnly"):
+        validate_value(information("Double", access="ReadOnly"), 1.0)
+    with pytest.raises(ValueError, match="above maximum"):
+        validate_value(information("Double", minimum=0.0, maximum=10.0), 10.5)
+    with pytest.raises(ValueError, match="expected Uint32"):
+        validate_value(information("Uint32"), 1.5)
+    with pytest.raises(ValueError, match="below minimum 0"):
+        validate_value(information("Uint32"), -1)
+
+
+def test_coerces_values():
+    assert validate_value(information("Double", maximum=10.0), "12", coerce=True) == 10.0
+    assert validate_value(information("Int32"), 3.0, coerce=True) == 3
+    assert validate_value(information("BoolArray"), [1, "false"], coerce=True) == [True, False]
+
+
+def test_coerce_clamps_to_fractional_bounds():
+    double = validate_value(information("Double", minimum=0.5), 0, coerce=True)
+    integer = information("Int32", minimum=0.5, maximum=9.5)
+
+    assert double == 0.5
+    assert isinstance(double, float)
+    assert validate_value(integer, 0, coerce=True) == 1
+    assert validate_value(integer, 12, coerce=True) == 9
+
+
+class FakeDevice:
+    def __init__(self, information):
+        self.information = information
+        self.requested = []
+
+    def get_property_information_batch(self, properties):
+        self.requested.append(properties)
+        return [self.information[property] for property, _ in properties]
+
+
+def test_validate_writes_reports_every_error():
+    device = FakeDevice(
+        {"AO.Voltage": information("Double", maximum=10.0), "Dev.Name": information("String", 1)}
+    )
+    writes = [
+        ("AO.Voltage", 1.0, "Mod1"),
+        ("AO.Voltage", 20.0, "Mod2"),
+        ("Dev.Name", "x", "Mod1"),
+    ]
+
+    with pytest.raises(PropertyValidationError) as error:
+        validate_writes(device, writes)
+
+    assert [(property, resources) for property, resources, *_ in error.value.errors] == [
+        ("AO.Voltage", "Mod2"),
+        ("Dev.Name", "Mod1"),
+    ]
+    assert len(device.requested) == 1